@@ -12,14 +12,313 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Tools for mutation operations (create, update) on Google Ads resources."""
-
-from typing import Any, Dict, List, Optional
+"""Tools for mutation operations (create, update) on Google Ads resources.
+
+Operations are built with raw protobuf messages rather than proto-plus
+wrappers, since each request sets many fields and proto-plus adds marshalling
+overhead to every field access.
+"""
+
+import asyncio
+import contextlib
+import functools
+import re
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
 from ads_mcp.coordinator import mcp
 import ads_mcp.utils as utils
 from google.ads.googleads.errors import GoogleAdsException
 
 
+def _get_ga_service():
+    """Returns a pooled GoogleAdsService client."""
+    return utils.get_googleads_service("GoogleAdsService")
+
+
+def _get_type(type_name: str):
+    """Returns a new instance of the raw protobuf message for type_name.
+
+    The shared client is created with use_proto_plus=False, so its types are
+    raw protobuf messages.
+    """
+    return utils.get_googleads_type(type_name)
+
+
+# Per-thread free lists of cleared MutateOperation messages. Operations are
+# returned once their request has been built, so long-running servers reuse
+# messages instead of allocating and looking up the type for every operation.
+_MAX_POOLED_OPERATIONS = 1000
+_operation_pool = threading.local()
+
+
+def _acquire_operation():
+    """Returns an empty MutateOperation, reusing a released one when available."""
+    pool = getattr(_operation_pool, "operations", None)
+    if pool:
+        return pool.pop()
+    return _get_type("MutateOperation")
+
+
+def _release_operations(mutate_operations: List) -> None:
+    """Clears operations and returns them to this thread's pool.
+
+    The operations must not be used by the caller afterwards.
+    """
+    pool = getattr(_operation_pool, "operations", None)
+    if pool is None:
+        pool = _operation_pool.operations = []
+    for mutate_operation in mutate_operations:
+        if len(pool) >= _MAX_POOLED_OPERATIONS:
+            break
+        mutate_operation.Clear()
+        pool.append(mutate_operation)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_enum_values(enum_type_name: str) -> Dict[str, int]:
+    """Maps the value names of an enum to their numbers.
+
+    Built once per enum, e.g. _get_enum_values("CampaignStatusEnum") returns
+    {"ENABLED": 2, "PAUSED": 3, "REMOVED": 4}. The UNSPECIFIED and UNKNOWN
+    placeholders are left out since they can't be set on a resource.
+    """
+    enum_wrapper = getattr(
+        _get_type(enum_type_name), enum_type_name.removesuffix("Enum")
+    )
+    return {
+        value_name: number
+        for value_name, number in enum_wrapper.items()
+        if value_name not in ("UNSPECIFIED", "UNKNOWN")
+    }
+
+
+def _get_enum_value(enum_type_name: str, value_name: str) -> int:
+    """Returns the number of an enum value, raising ValueError for unknown names."""
+    enum_values = _get_enum_values(enum_type_name)
+    try:
+        return enum_values[value_name]
+    except KeyError:
+        raise ValueError(
+            f"Invalid value '{value_name}' for {enum_type_name.removesuffix('Enum')}. "
+            f"Valid values are: {', '.join(enum_values)}"
+        ) from None
+
+
+# Resource name formatters, called with (customer_id, resource_id)
+_CAMPAIGN_BUDGET_RESOURCE_NAME = "customers/{}/campaignBudgets/{}".format
+_CAMPAIGN_RESOURCE_NAME = "customers/{}/campaigns/{}".format
+_AD_GROUP_RESOURCE_NAME = "customers/{}/adGroups/{}".format
+
+
+# Input validation. These checks run before any request is built so that
+# malformed input is rejected without a round trip to the API. Enum values are
+# checked against the client library's enums, see _get_enum_values. The
+# _validate_* helpers return an error message, or None if the input is valid.
+_MAX_MICROS = 10**15
+_MAX_KEYWORD_LENGTH = 80
+_MIN_HEADLINES, _MAX_HEADLINES, _MAX_HEADLINE_LENGTH = 3, 15, 30
+_MIN_DESCRIPTIONS, _MAX_DESCRIPTIONS, _MAX_DESCRIPTION_LENGTH = 2, 4, 90
+_MAX_PATH_LENGTH = 15
+
+
+def _validate_customer_id(customer_id: str) -> Optional[str]:
+    if not re.fullmatch(r"[0-9]{10}", customer_id):
+        return (
+            f"Invalid customer_id '{customer_id}': expected 10 digits without "
+            "hyphens"
+        )
+    return None
+
+
+def _validate_id(value: str, field_name: str) -> Optional[str]:
+    if not re.fullmatch(r"[0-9]+", str(value)):
+        return f"Invalid {field_name} '{value}': expected a numeric ID"
+    return None
+
+
+def _validate_choice(
+    value: str, valid_values: Dict[str, int], field_name: str
+) -> Optional[str]:
+    if value not in valid_values:
+        return (
+            f"Invalid {field_name} '{value}'. Valid values are: "
+            f"{', '.join(sorted(valid_values))}"
+        )
+    return None
+
+
+def _validate_micros(value: Optional[int], field_name: str) -> Optional[str]:
+    if value is not None and not 0 < value < _MAX_MICROS:
+        return (
+            f"Invalid {field_name} {value}: must be a positive amount in micros"
+        )
+    return None
+
+
+def _validate_resource_name(
+    resource_name: str, customer_id: str, collection: str, field_name: str
+) -> Optional[str]:
+    """Checks that resource_name is a collection resource of customer_id."""
+    if not re.fullmatch(
+        rf"customers/{re.escape(customer_id)}/{collection}/[0-9]+",
+        resource_name,
+    ):
+        return (
+            f"Invalid {field_name} '{resource_name}': expected "
+            f"customers/{customer_id}/{collection}/<ID>"
+        )
+    return None
+
+
+def _validate_campaign(
+    name: Optional[str],
+    budget_amount_micros: Optional[int],
+    advertising_channel_type: str,
+    status: str,
+    budget_delivery_method: str,
+) -> Optional[str]:
+    if not name:
+        return "A campaign name is required"
+    if budget_amount_micros is None:
+        return "A campaign budget_amount_micros is required"
+    return (
+        _validate_micros(budget_amount_micros, "budget_amount_micros")
+        or _validate_choice(
+            advertising_channel_type,
+            _get_enum_values("AdvertisingChannelTypeEnum"),
+            "advertising_channel_type",
+        )
+        or _validate_choice(
+            status, _get_enum_values("CampaignStatusEnum"), "status"
+        )
+        or _validate_choice(
+            budget_delivery_method,
+            _get_enum_values("BudgetDeliveryMethodEnum"),
+            "budget_delivery_method",
+        )
+    )
+
+
+def _validate_ad_group(
+    name: Optional[str], cpc_bid_micros: int, status: str
+) -> Optional[str]:
+    if not name:
+        return "An ad group name is required"
+    return (
+        _validate_micros(cpc_bid_micros, "cpc_bid_micros")
+        or _validate_choice(
+            status, _get_enum_values("AdGroupStatusEnum"), "status"
+        )
+    )
+
+
+def _validate_keyword(
+    text: Optional[str], match_type: str, cpc_bid_micros: Optional[int]
+) -> Optional[str]:
+    if not text:
+        return "Keyword text is required"
+    if len(text) > _MAX_KEYWORD_LENGTH:
+        return (
+            f"Keyword '{text}' is longer than {_MAX_KEYWORD_LENGTH} characters"
+        )
+    return (
+        _validate_choice(
+            match_type, _get_enum_values("KeywordMatchTypeEnum"), "match_type"
+        )
+        or _validate_micros(cpc_bid_micros, "cpc_bid_micros")
+    )
+
+
+def _validate_responsive_search_ad(
+    headlines: Optional[List[str]],
+    descriptions: Optional[List[str]],
+    final_urls: Optional[List[str]],
+    path1: Optional[str] = None,
+    path2: Optional[str] = None,
+) -> Optional[str]:
+    headlines = headlines or []
+    descriptions = descriptions or []
+    if not _MIN_HEADLINES <= len(headlines) <= _MAX_HEADLINES:
+        return (
+            f"A responsive search ad needs {_MIN_HEADLINES}-{_MAX_HEADLINES} "
+            f"headlines, got {len(headlines)}"
+        )
+    if not _MIN_DESCRIPTIONS <= len(descriptions) <= _MAX_DESCRIPTIONS:
+        return (
+            "A responsive search ad needs "
+            f"{_MIN_DESCRIPTIONS}-{_MAX_DESCRIPTIONS} descriptions, "
+            f"got {len(descriptions)}"
+        )
+    for headline in headlines:
+        if len(headline) > _MAX_HEADLINE_LENGTH:
+            return (
+                f"Headline '{headline}' is longer than "
+                f"{_MAX_HEADLINE_LENGTH} characters"
+            )
+    for description in descriptions:
+        if len(description) > _MAX_DESCRIPTION_LENGTH:
+            return (
+                f"Description '{description}' is longer than "
+                f"{_MAX_DESCRIPTION_LENGTH} characters"
+            )
+    if not final_urls:
+        return "At least one final URL is required"
+    if path2 and not path1:
+        return "path2 can only be set if path1 is also set"
+    for path in (path1, path2):
+        if path and len(path) > _MAX_PATH_LENGTH:
+            return f"Path '{path}' is longer than {_MAX_PATH_LENGTH} characters"
+    return None
+
+
+def _validate_ad_group_spec(ad_group: Dict[str, Any]) -> Optional[str]:
+    return _validate_ad_group(
+        ad_group.get("name"),
+        ad_group.get("cpc_bid_micros", 1000000),
+        ad_group.get("status", "ENABLED"),
+    )
+
+
+def _validate_responsive_search_ad_spec(ad: Dict[str, Any]) -> Optional[str]:
+    return _validate_responsive_search_ad(
+        ad.get("headlines"),
+        ad.get("descriptions"),
+        ad.get("final_urls"),
+        ad.get("path1"),
+        ad.get("path2"),
+    )
+
+
+def _validate_keyword_spec(keyword: Dict[str, Any]) -> Optional[str]:
+    return _validate_keyword(
+        keyword.get("text"),
+        keyword.get("match_type", "BROAD"),
+        keyword.get("cpc_bid_micros"),
+    )
+
+
+def _validate_batch_job_keyword_spec(
+    keyword: Dict[str, Any]
+) -> Optional[str]:
+    return (
+        _validate_id(keyword.get("ad_group_id", ""), "ad_group_id")
+        or _validate_keyword_spec(keyword)
+    )
+
+
+def _validate_specs(
+    specs: List[Dict[str, Any]], validate, label: str
+) -> Optional[str]:
+    """Runs validate on each spec, returning the first error with its index."""
+    for index, spec in enumerate(specs):
+        validation_error = validate(spec)
+        if validation_error:
+            return f"{label} {index}: {validation_error}"
+    return None
+
+
 def _extract_error_details(ex: GoogleAdsException) -> str:
     """Extract human-readable error details from a GoogleAdsException."""
     error_messages = []
@@ -30,7 +329,335 @@ def _extract_error_details(ex: GoogleAdsException) -> str:
     return "; ".join(error_messages) if error_messages else str(ex)
 
 
+# Upper bound on mutate requests in flight from the non-blocking tools. Higher
+# concurrency against the same account tends to trigger CONCURRENT_MODIFICATION
+# and rate limit errors.
+_MAX_CONCURRENT_MUTATES = 10
+_mutate_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_MUTATES)
+
+
+async def _run_in_thread(func, *args, **kwargs):
+    """Runs a blocking tool in a worker thread, bounded by _mutate_semaphore."""
+    async with _mutate_semaphore:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+def _non_blocking(func):
+    """Makes a blocking tool a coroutine that runs it with _run_in_thread.
+
+    The wrapper keeps the signature and docstring of the tool, so the tool
+    schema is unchanged while the server handles other calls in the meantime.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await _run_in_thread(func, *args, **kwargs)
+
+    return wrapper
+
+
+# The API rejects mutate requests with more than 5,000 operations, so bulk
+# tools split their operations into smaller requests.
+_MUTATE_MAX_OPERATIONS = 5000
+_MUTATE_BATCH_SIZE = 1000
+
+
+def _split_partial_failure_errors(
+    response, offset: int = 0
+) -> Tuple[Dict[int, List[str]], List[str]]:
+    """Splits the errors of a partial failure response by whether they are located.
+
+    Args:
+        response: A MutateGoogleAdsResponse from a request sent with partial_failure.
+        offset: Added to each operation index, for responses to a chunk of a
+            larger list of operations.
+
+    Returns:
+        A tuple of (located, unlocated). located maps the index of each failed
+        operation to its error messages. unlocated holds the messages of errors
+        that don't point at an operation, or the status message of a failure
+        that carries no errors at all.
+    """
+    partial_failure_error = response.partial_failure_error
+    if not partial_failure_error.code:
+        return {}, []
+
+    failure_type = type(_get_type("GoogleAdsFailure"))
+    located: Dict[int, List[str]] = {}
+    unlocated = []
+    for detail in partial_failure_error.details:
+        failure = failure_type.FromString(detail.value)
+        for error in failure.errors:
+            message = f"{error.error_code}: {error.message}"
+            # The first path element points at the failed entry in mutate_operations
+            if not error.location.field_path_elements:
+                unlocated.append(message)
+                continue
+            index = offset + error.location.field_path_elements[0].index
+            located.setdefault(index, []).append(message)
+
+    if not located and not unlocated:
+        unlocated.append(
+            partial_failure_error.message
+            or f"Partial failure with code {partial_failure_error.code}"
+        )
+    return located, unlocated
+
+
+def _join_partial_failure_errors(
+    located: Dict[int, List[str]], unlocated: List[str], offset: int = 0
+) -> Dict[int, str]:
+    """Joins the error messages of each failed operation into one string.
+
+    Errors that don't point at an operation are reported under the first
+    operation's index, so that callers don't mistake them for a success.
+    """
+    error_messages = {index: list(messages) for index, messages in located.items()}
+    if unlocated:
+        error_messages.setdefault(offset, []).extend(unlocated)
+    return {
+        index: "; ".join(messages) for index, messages in error_messages.items()
+    }
+
+
+def _get_partial_failure_errors(response, offset: int = 0) -> Dict[int, str]:
+    """Maps the index of each failed operation in a partial failure response to its errors.
+
+    Args:
+        response: A MutateGoogleAdsResponse from a request sent with partial_failure.
+        offset: Added to each operation index, for responses to a chunk of a
+            larger list of operations.
+    """
+    located, unlocated = _split_partial_failure_errors(response, offset)
+    return _join_partial_failure_errors(located, unlocated, offset)
+
+
+# Locks serializing mutate requests that touch the same resource, keyed by
+# resource name. Concurrent changes to one resource (e.g. a budget), or
+# concurrent creates under one parent (e.g. keywords in an ad group), fail
+# with CONCURRENT_MODIFICATION. Entries disappear once no request holds or
+# waits on the lock.
+_resource_locks: "weakref.WeakValueDictionary[str, threading.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+_resource_locks_lock = threading.Lock()
+
+# The field of each created resource that names the resource it is created
+# under, keyed by the MutateOperation field holding the operation.
+_PARENT_RESOURCE_FIELDS = {
+    "campaign_operation": "campaign_budget",
+    "ad_group_operation": "campaign",
+    "ad_group_ad_operation": "ad_group",
+    "ad_group_criterion_operation": "ad_group",
+}
+
+
+def _get_resource_lock(resource_name: str) -> threading.Lock:
+    with _resource_locks_lock:
+        lock = _resource_locks.get(resource_name)
+        if lock is None:
+            lock = threading.Lock()
+            _resource_locks[resource_name] = lock
+        return lock
+
+
+def _get_locked_resource_name(mutate_operation) -> Optional[str]:
+    """Returns the resource a request sending mutate_operation must lock, if any.
+
+    That is the resource an update or remove targets, or the parent a create
+    adds to. Resources with temporary (negative) IDs only exist within their
+    request, so they are never locked.
+    """
+    operation_field = mutate_operation.WhichOneof("operation")
+    if operation_field is None:
+        return None
+    operation = getattr(mutate_operation, operation_field)
+    action = operation.WhichOneof("operation")
+    if action == "update":
+        resource_name = operation.update.resource_name
+    elif action == "remove":
+        resource_name = operation.remove
+    elif action == "create" and operation_field in _PARENT_RESOURCE_FIELDS:
+        resource_name = getattr(
+            operation.create, _PARENT_RESOURCE_FIELDS[operation_field]
+        )
+    else:
+        return None
+    if not resource_name or resource_name.rsplit("/", 1)[-1].startswith("-"):
+        return None
+    return resource_name
+
+
+def _mutate(
+    ga_service,
+    customer_id: str,
+    mutate_operations: List,
+    response_content_type: Optional[str] = "RESOURCE_NAME_ONLY",
+    partial_failure: bool = True,
+):
+    """Sends mutate_operations in a single request.
+
+    Requests that modify the same resource, or create resources under the same
+    parent, are sent one at a time.
+    The operations are released to the operation pool and must not be used
+    after this call.
+
+    Args:
+        ga_service: The GoogleAdsService client to send the request with.
+        customer_id: The Google Ads customer ID (without hyphens)
+        mutate_operations: The MutateOperations to send.
+        response_content_type: ResponseContentType name. The tools only read
+            resource names, so the server is asked not to echo back the full
+            mutated resources. None leaves the field unset.
+        partial_failure: Whether valid operations are applied even if others
+            fail. Pass False for operations chained through temporary IDs
+            that must be created together or not at all.
+    """
+    request = _get_type("MutateGoogleAdsRequest")
+    request.customer_id = customer_id
+    request.mutate_operations.extend(mutate_operations)
+    # Only the required request fields are flattened into mutate()'s keyword
+    # arguments, so the request message is built explicitly.
+    request.partial_failure = partial_failure
+    if response_content_type is not None:
+        request.response_content_type = _get_enum_value(
+            "ResponseContentTypeEnum", response_content_type
+        )
+
+    # Locks are taken in sorted order so that two requests sharing several
+    # resources can't deadlock.
+    locked_resource_names = sorted(
+        {
+            resource_name
+            for resource_name in map(_get_locked_resource_name, mutate_operations)
+            if resource_name
+        }
+    )
+    # The request holds its own copies of the operations
+    _release_operations(mutate_operations)
+
+    with contextlib.ExitStack() as stack:
+        for resource_name in locked_resource_names:
+            stack.enter_context(_get_resource_lock(resource_name))
+        return ga_service.mutate(request=request)
+
+
+def _mutate_in_batches(
+    ga_service, customer_id: str, mutate_operations: List, result_field: str
+) -> Tuple[List[str], Dict[int, str], Optional[str]]:
+    """Sends operations in chunks of _MUTATE_BATCH_SIZE.
+
+    Each chunk is committed on its own, so a request that fails outright (e.g.
+    on quota or authentication errors) does not undo the chunks before it.
+    Sending stops at the first such failure, and the operations of that chunk
+    and of the chunks that were never sent are reported as failed.
+
+    Args:
+        ga_service: The GoogleAdsService client to send the requests with.
+        customer_id: The Google Ads customer ID (without hyphens)
+        mutate_operations: The MutateOperations to send.
+        result_field: The MutateOperationResponse field holding the result,
+            e.g. "ad_group_result".
+
+    Returns:
+        A tuple of (resource_names, errors, request_error). resource_names is in
+        the order of mutate_operations, with empty strings for operations that
+        failed. errors maps the index of each failed operation to its error
+        message. request_error is the error of the request that failed
+        outright, or None.
+    """
+    resource_names = []
+    errors = {}
+    for start in range(0, len(mutate_operations), _MUTATE_BATCH_SIZE):
+        chunk = mutate_operations[start:start + _MUTATE_BATCH_SIZE]
+        try:
+            response = _mutate(ga_service, customer_id, chunk)
+        except GoogleAdsException as ex:
+            request_error = _extract_error_details(ex)
+        except Exception as ex:
+            request_error = str(ex)
+        else:
+            resource_names.extend(
+                getattr(operation_response, result_field).resource_name
+                for operation_response in response.mutate_operation_responses
+            )
+            errors.update(_get_partial_failure_errors(response, offset=start))
+            continue
+
+        utils.logger.error(
+            "ads_mcp: Mutate request for operations %d-%d failed: %s",
+            start,
+            start + len(chunk) - 1,
+            request_error,
+        )
+        for index in range(start, start + len(chunk)):
+            errors[index] = request_error
+        for index in range(start + len(chunk), len(mutate_operations)):
+            errors[index] = "Not sent because an earlier request failed"
+        resource_names.extend([""] * (len(mutate_operations) - start))
+        return resource_names, errors, request_error
+
+    return resource_names, errors, None
+
+
+def _build_campaign_budget_operation(
+    budget_resource_name: str,
+    name: str,
+    budget_amount_micros: int,
+    budget_delivery_method: str = "STANDARD",
+):
+    """Returns a MutateOperation that creates a non-shared campaign budget.
+
+    budget_resource_name should use a temporary (negative) ID so that the
+    campaign created in the same request can reference the budget.
+    """
+    mutate_operation = _acquire_operation()
+    campaign_budget = mutate_operation.campaign_budget_operation.create
+
+    campaign_budget.resource_name = budget_resource_name
+    campaign_budget.name = name
+    campaign_budget.amount_micros = budget_amount_micros
+    campaign_budget.delivery_method = _get_enum_value("BudgetDeliveryMethodEnum", budget_delivery_method)
+    campaign_budget.explicitly_shared = False
+
+    return mutate_operation
+
+
+def _build_campaign_operation(
+    budget_resource_name: str,
+    name: str,
+    advertising_channel_type: str = "SEARCH",
+    status: str = "PAUSED",
+    campaign_resource_name: Optional[str] = None,
+):
+    """Returns a MutateOperation that creates a campaign using an existing or temporary budget.
+
+    campaign_resource_name is only needed when other operations in the same
+    request reference the campaign through a temporary ID.
+    """
+    mutate_operation = _acquire_operation()
+    campaign = mutate_operation.campaign_operation.create
+
+    if campaign_resource_name:
+        campaign.resource_name = campaign_resource_name
+    campaign.name = name
+    campaign.advertising_channel_type = _get_enum_value("AdvertisingChannelTypeEnum", advertising_channel_type)
+    campaign.status = _get_enum_value("CampaignStatusEnum", status)
+    campaign.campaign_budget = budget_resource_name
+
+    # Set network settings for Search campaigns
+    if advertising_channel_type == "SEARCH":
+        network_settings = campaign.network_settings
+        network_settings.target_google_search = True
+        network_settings.target_search_network = True
+        network_settings.target_content_network = False
+        network_settings.target_partner_search_network = False
+
+    return mutate_operation
+
+
 @mcp.tool()
+@_non_blocking
 def create_campaign(
     customer_id: str,
     name: str,
@@ -60,52 +687,44 @@ def create_campaign(
             - error: Error message if operation failed
     """
     try:
-        ga_service = utils.get_googleads_service("GoogleAdsService")
-
-        # Get enum types for validation
-        campaign_status_enum = utils.get_googleads_type("CampaignStatusEnum").CampaignStatus
-        channel_type_enum = utils.get_googleads_type("AdvertisingChannelTypeEnum").AdvertisingChannelType
-        delivery_method_enum = utils.get_googleads_type("BudgetDeliveryMethodEnum").BudgetDeliveryMethod
+        validation_error = _validate_customer_id(customer_id) or _validate_campaign(
+            name, budget_amount_micros, advertising_channel_type, status, budget_delivery_method
+        )
+        if validation_error:
+            return {
+                "success": False,
+                "error": validation_error,
+            }
 
-        # Create the campaign budget operation
-        campaign_budget_operation = utils.get_googleads_type("MutateOperation")
-        campaign_budget = campaign_budget_operation.campaign_budget_operation.create
+        ga_service = _get_ga_service()
 
         # Use a temporary ID for the budget (negative number)
         # This allows us to reference it in the campaign before it's created
-        temp_budget_id = -1
-        campaign_budget.resource_name = f"customers/{customer_id}/campaignBudgets/{temp_budget_id}"
-        campaign_budget.name = f"{name} Budget"
-        campaign_budget.amount_micros = budget_amount_micros
-        campaign_budget.delivery_method = getattr(delivery_method_enum, budget_delivery_method)
-        campaign_budget.explicitly_shared = False
-
-        # Create the campaign operation
-        campaign_operation = utils.get_googleads_type("MutateOperation")
-        campaign = campaign_operation.campaign_operation.create
-
-        campaign.name = name
-        campaign.advertising_channel_type = getattr(channel_type_enum, advertising_channel_type)
-        campaign.status = getattr(campaign_status_enum, status)
-
-        # Link to the budget using the temporary resource name
-        campaign.campaign_budget = f"customers/{customer_id}/campaignBudgets/{temp_budget_id}"
-
-        # Set network settings for Search campaigns
-        if advertising_channel_type == "SEARCH":
-            campaign.network_settings.target_google_search = True
-            campaign.network_settings.target_search_network = True
-            campaign.network_settings.target_content_network = False
-            campaign.network_settings.target_partner_search_network = False
+        temp_budget_resource_name = _CAMPAIGN_BUDGET_RESOURCE_NAME(customer_id, -1)
+
+        campaign_budget_operation = _build_campaign_budget_operation(
+            temp_budget_resource_name,
+            f"{name} Budget",
+            budget_amount_micros,
+            budget_delivery_method,
+        )
+        campaign_operation = _build_campaign_operation(
+            temp_budget_resource_name, name, advertising_channel_type, status
+        )
 
         utils.logger.info(
-            f"ads_mcp.create_campaign: Creating campaign '{name}' for customer {customer_id}"
+            "ads_mcp.create_campaign: Creating campaign '%s' for customer %s",
+            name,
+            customer_id,
         )
 
-        # Execute both operations in a single atomic request
-        response = ga_service.mutate(
-            customer_id=customer_id,
-            mutate_operations=[campaign_budget_operation, campaign_operation],
+        # Execute both operations in a single atomic request, so that a
+        # failed campaign doesn't leave its budget behind
+        response = _mutate(
+            ga_service,
+            customer_id,
+            [campaign_budget_operation, campaign_operation],
+            partial_failure=False,
         )
 
         # Extract results
@@ -113,10 +732,12 @@ def create_campaign(
         campaign_result = response.mutate_operation_responses[1].campaign_result
 
         # Extract campaign ID from resource name
-        campaign_id = campaign_result.resource_name.split("/")[-1]
+        campaign_id = campaign_result.resource_name.rsplit("/", 1)[-1]
+        _cache_budget_resource_name(customer_id, campaign_id, budget_result.resource_name)
 
         utils.logger.info(
-            f"ads_mcp.create_campaign: Successfully created campaign {campaign_id}"
+            "ads_mcp.create_campaign: Successfully created campaign %s",
+            campaign_id,
         )
 
         return {
@@ -128,20 +749,46 @@ def create_campaign(
 
     except GoogleAdsException as ex:
         error_detail = _extract_error_details(ex)
-        utils.logger.error(f"ads_mcp.create_campaign failed: {error_detail}")
+        utils.logger.error("ads_mcp.create_campaign failed: %s", error_detail)
         return {
             "success": False,
             "error": error_detail,
         }
     except Exception as ex:
-        utils.logger.error(f"ads_mcp.create_campaign unexpected error: {ex}")
+        utils.logger.error("ads_mcp.create_campaign unexpected error: %s", ex)
         return {
             "success": False,
             "error": str(ex),
         }
 
 
+def _build_ad_group_operation(
+    campaign_resource_name: str,
+    name: str,
+    cpc_bid_micros: int = 1000000,
+    status: str = "ENABLED",
+    ad_group_resource_name: Optional[str] = None,
+):
+    """Returns a MutateOperation that creates an ad group in a campaign.
+
+    ad_group_resource_name is only needed when other operations in the same
+    request reference the ad group through a temporary ID.
+    """
+    mutate_operation = _acquire_operation()
+    ad_group = mutate_operation.ad_group_operation.create
+
+    if ad_group_resource_name:
+        ad_group.resource_name = ad_group_resource_name
+    ad_group.name = name
+    ad_group.campaign = campaign_resource_name
+    ad_group.status = _get_enum_value("AdGroupStatusEnum", status)
+    ad_group.cpc_bid_micros = cpc_bid_micros
+
+    return mutate_operation
+
+
 @mcp.tool()
+@_non_blocking
 def create_ad_group(
     customer_id: str,
     campaign_id: str,
@@ -167,33 +814,49 @@ def create_ad_group(
             - error: Error message if operation failed
     """
     try:
-        ga_service = utils.get_googleads_service("GoogleAdsService")
-
-        ad_group_status_enum = utils.get_googleads_type("AdGroupStatusEnum").AdGroupStatus
+        validation_error = (
+            _validate_customer_id(customer_id)
+            or _validate_id(campaign_id, "campaign_id")
+            or _validate_ad_group(name, cpc_bid_micros, status)
+        )
+        if validation_error:
+            return {
+                "success": False,
+                "error": validation_error,
+            }
 
-        # Create the ad group operation
-        mutate_operation = utils.get_googleads_type("MutateOperation")
-        ad_group = mutate_operation.ad_group_operation.create
+        ga_service = _get_ga_service()
 
-        ad_group.name = name
-        ad_group.campaign = f"customers/{customer_id}/campaigns/{campaign_id}"
-        ad_group.status = getattr(ad_group_status_enum, status)
-        ad_group.cpc_bid_micros = cpc_bid_micros
+        mutate_operation = _build_ad_group_operation(
+            _CAMPAIGN_RESOURCE_NAME(customer_id, campaign_id),
+            name,
+            cpc_bid_micros,
+            status,
+        )
 
         utils.logger.info(
-            f"ads_mcp.create_ad_group: Creating ad group '{name}' in campaign {campaign_id}"
+            "ads_mcp.create_ad_group: Creating ad group '%s' in campaign %s",
+            name,
+            campaign_id,
         )
 
-        response = ga_service.mutate(
-            customer_id=customer_id,
-            mutate_operations=[mutate_operation],
-        )
+        response = _mutate(ga_service, customer_id, [mutate_operation])
+
+        partial_failure_errors = _get_partial_failure_errors(response)
+        if partial_failure_errors:
+            error_detail = partial_failure_errors[0]
+            utils.logger.error("ads_mcp.create_ad_group failed: %s", error_detail)
+            return {
+                "success": False,
+                "error": error_detail,
+            }
 
         ad_group_result = response.mutate_operation_responses[0].ad_group_result
-        ad_group_id = ad_group_result.resource_name.split("/")[-1]
+        ad_group_id = ad_group_result.resource_name.rsplit("/", 1)[-1]
 
         utils.logger.info(
-            f"ads_mcp.create_ad_group: Successfully created ad group {ad_group_id}"
+            "ads_mcp.create_ad_group: Successfully created ad group %s",
+            ad_group_id,
         )
 
         return {
@@ -204,20 +867,59 @@ def create_ad_group(
 
     except GoogleAdsException as ex:
         error_detail = _extract_error_details(ex)
-        utils.logger.error(f"ads_mcp.create_ad_group failed: {error_detail}")
+        utils.logger.error("ads_mcp.create_ad_group failed: %s", error_detail)
         return {
             "success": False,
             "error": error_detail,
         }
     except Exception as ex:
-        utils.logger.error(f"ads_mcp.create_ad_group unexpected error: {ex}")
+        utils.logger.error("ads_mcp.create_ad_group unexpected error: %s", ex)
         return {
             "success": False,
             "error": str(ex),
         }
 
 
+def _build_responsive_search_ad_operation(
+    ad_group_resource_name: str,
+    headlines: List[str],
+    descriptions: List[str],
+    final_urls: List[str],
+    path1: Optional[str] = None,
+    path2: Optional[str] = None,
+):
+    """Returns a MutateOperation that creates a responsive search ad in an ad group."""
+    mutate_operation = _acquire_operation()
+    ad_group_ad = mutate_operation.ad_group_ad_operation.create
+
+    ad_group_ad.ad_group = ad_group_resource_name
+    ad_group_ad.status = _get_enum_value("AdGroupAdStatusEnum", "ENABLED")
+
+    # Set up the responsive search ad
+    ad = ad_group_ad.ad
+    ad.final_urls.extend(final_urls)
+    responsive_search_ad = ad.responsive_search_ad
+
+    # Add headlines and descriptions, constructing each AdTextAsset in place
+    add_headline = responsive_search_ad.headlines.add
+    for headline_text in headlines:
+        add_headline(text=headline_text)
+
+    add_description = responsive_search_ad.descriptions.add
+    for description_text in descriptions:
+        add_description(text=description_text)
+
+    # Set optional paths
+    if path1:
+        responsive_search_ad.path1 = path1
+    if path2:
+        responsive_search_ad.path2 = path2
+
+    return mutate_operation
+
+
 @mcp.tool()
+@_non_blocking
 def create_responsive_search_ad(
     customer_id: str,
     ad_group_id: str,
@@ -248,63 +950,48 @@ def create_responsive_search_ad(
             - error: Error message if operation failed
     """
     try:
-        if len(headlines) < 3:
-            return {
-                "success": False,
-                "error": "At least 3 headlines are required for a responsive search ad",
-            }
-        if len(descriptions) < 2:
+        validation_error = (
+            _validate_customer_id(customer_id)
+            or _validate_id(ad_group_id, "ad_group_id")
+            or _validate_responsive_search_ad(headlines, descriptions, final_urls, path1, path2)
+        )
+        if validation_error:
             return {
                 "success": False,
-                "error": "At least 2 descriptions are required for a responsive search ad",
+                "error": validation_error,
             }
 
-        ga_service = utils.get_googleads_service("GoogleAdsService")
-
-        ad_group_ad_status_enum = utils.get_googleads_type("AdGroupAdStatusEnum").AdGroupAdStatus
-
-        # Create the ad group ad operation
-        mutate_operation = utils.get_googleads_type("MutateOperation")
-        ad_group_ad = mutate_operation.ad_group_ad_operation.create
-
-        ad_group_ad.ad_group = f"customers/{customer_id}/adGroups/{ad_group_id}"
-        ad_group_ad.status = ad_group_ad_status_enum.ENABLED
-
-        # Set up the responsive search ad
-        ad = ad_group_ad.ad
-        ad.final_urls.extend(final_urls)
-
-        # Add headlines
-        for headline_text in headlines:
-            ad_text_asset = utils.get_googleads_type("AdTextAsset")
-            ad_text_asset.text = headline_text
-            ad.responsive_search_ad.headlines.append(ad_text_asset)
-
-        # Add descriptions
-        for description_text in descriptions:
-            ad_text_asset = utils.get_googleads_type("AdTextAsset")
-            ad_text_asset.text = description_text
-            ad.responsive_search_ad.descriptions.append(ad_text_asset)
+        ga_service = _get_ga_service()
 
-        # Set optional paths
-        if path1:
-            ad.responsive_search_ad.path1 = path1
-        if path2:
-            ad.responsive_search_ad.path2 = path2
+        mutate_operation = _build_responsive_search_ad_operation(
+            _AD_GROUP_RESOURCE_NAME(customer_id, ad_group_id),
+            headlines,
+            descriptions,
+            final_urls,
+            path1,
+            path2,
+        )
 
         utils.logger.info(
-            f"ads_mcp.create_responsive_search_ad: Creating RSA in ad group {ad_group_id}"
+            "ads_mcp.create_responsive_search_ad: Creating RSA in ad group %s",
+            ad_group_id,
         )
 
-        response = ga_service.mutate(
-            customer_id=customer_id,
-            mutate_operations=[mutate_operation],
-        )
+        response = _mutate(ga_service, customer_id, [mutate_operation])
+
+        partial_failure_errors = _get_partial_failure_errors(response)
+        if partial_failure_errors:
+            error_detail = partial_failure_errors[0]
+            utils.logger.error("ads_mcp.create_responsive_search_ad failed: %s", error_detail)
+            return {
+                "success": False,
+                "error": error_detail,
+            }
 
         ad_group_ad_result = response.mutate_operation_responses[0].ad_group_ad_result
 
         utils.logger.info(
-            f"ads_mcp.create_responsive_search_ad: Successfully created RSA"
+            "ads_mcp.create_responsive_search_ad: Successfully created RSA"
         )
 
         return {
@@ -314,20 +1001,46 @@ def create_responsive_search_ad(
 
     except GoogleAdsException as ex:
         error_detail = _extract_error_details(ex)
-        utils.logger.error(f"ads_mcp.create_responsive_search_ad failed: {error_detail}")
+        utils.logger.error("ads_mcp.create_responsive_search_ad failed: %s", error_detail)
         return {
             "success": False,
             "error": error_detail,
         }
     except Exception as ex:
-        utils.logger.error(f"ads_mcp.create_responsive_search_ad unexpected error: {ex}")
+        utils.logger.error("ads_mcp.create_responsive_search_ad unexpected error: %s", ex)
         return {
             "success": False,
             "error": str(ex),
         }
 
 
+def _build_keyword_operation(
+    ad_group_resource_name: str,
+    text: str,
+    match_type: str = "BROAD",
+    cpc_bid_micros: Optional[int] = None,
+):
+    """Returns a MutateOperation that creates a keyword criterion in an ad group."""
+    mutate_operation = _acquire_operation()
+    ad_group_criterion = mutate_operation.ad_group_criterion_operation.create
+
+    ad_group_criterion.ad_group = ad_group_resource_name
+    ad_group_criterion.status = _get_enum_value("AdGroupCriterionStatusEnum", "ENABLED")
+
+    # Set keyword info
+    keyword = ad_group_criterion.keyword
+    keyword.text = text
+    keyword.match_type = _get_enum_value("KeywordMatchTypeEnum", match_type)
+
+    # Set optional CPC bid
+    if cpc_bid_micros is not None:
+        ad_group_criterion.cpc_bid_micros = cpc_bid_micros
+
+    return mutate_operation
+
+
 @mcp.tool()
+@_non_blocking
 def create_keyword(
     customer_id: str,
     ad_group_id: str,
@@ -337,6 +1050,10 @@ def create_keyword(
 ) -> Dict[str, Any]:
     """Creates a keyword criterion in an ad group.
 
+    To add several keywords to an ad group, use create_keywords_bulk instead:
+    it sends them in one request, while concurrent creates in the same ad group
+    can fail with CONCURRENT_MODIFICATION.
+
     Args:
         customer_id: The Google Ads customer ID (without hyphens)
         ad_group_id: The ID of the ad group to add the keyword to
@@ -355,39 +1072,48 @@ def create_keyword(
             - error: Error message if operation failed
     """
     try:
-        ga_service = utils.get_googleads_service("GoogleAdsService")
-
-        keyword_match_type_enum = utils.get_googleads_type("KeywordMatchTypeEnum").KeywordMatchType
-        criterion_status_enum = utils.get_googleads_type("AdGroupCriterionStatusEnum").AdGroupCriterionStatus
-
-        # Create the ad group criterion operation
-        mutate_operation = utils.get_googleads_type("MutateOperation")
-        ad_group_criterion = mutate_operation.ad_group_criterion_operation.create
-
-        ad_group_criterion.ad_group = f"customers/{customer_id}/adGroups/{ad_group_id}"
-        ad_group_criterion.status = criterion_status_enum.ENABLED
+        validation_error = (
+            _validate_customer_id(customer_id)
+            or _validate_id(ad_group_id, "ad_group_id")
+            or _validate_keyword(text, match_type, cpc_bid_micros)
+        )
+        if validation_error:
+            return {
+                "success": False,
+                "error": validation_error,
+            }
 
-        # Set keyword info
-        ad_group_criterion.keyword.text = text
-        ad_group_criterion.keyword.match_type = getattr(keyword_match_type_enum, match_type)
+        ga_service = _get_ga_service()
 
-        # Set optional CPC bid
-        if cpc_bid_micros is not None:
-            ad_group_criterion.cpc_bid_micros = cpc_bid_micros
+        mutate_operation = _build_keyword_operation(
+            _AD_GROUP_RESOURCE_NAME(customer_id, ad_group_id),
+            text,
+            match_type,
+            cpc_bid_micros,
+        )
 
         utils.logger.info(
-            f"ads_mcp.create_keyword: Creating keyword '{text}' ({match_type}) in ad group {ad_group_id}"
+            "ads_mcp.create_keyword: Creating keyword '%s' (%s) in ad group %s",
+            text,
+            match_type,
+            ad_group_id,
         )
 
-        response = ga_service.mutate(
-            customer_id=customer_id,
-            mutate_operations=[mutate_operation],
-        )
+        response = _mutate(ga_service, customer_id, [mutate_operation])
+
+        partial_failure_errors = _get_partial_failure_errors(response)
+        if partial_failure_errors:
+            error_detail = partial_failure_errors[0]
+            utils.logger.error("ads_mcp.create_keyword failed: %s", error_detail)
+            return {
+                "success": False,
+                "error": error_detail,
+            }
 
         criterion_result = response.mutate_operation_responses[0].ad_group_criterion_result
 
         utils.logger.info(
-            f"ads_mcp.create_keyword: Successfully created keyword"
+            "ads_mcp.create_keyword: Successfully created keyword"
         )
 
         return {
@@ -397,19 +1123,81 @@ def create_keyword(
 
     except GoogleAdsException as ex:
         error_detail = _extract_error_details(ex)
-        utils.logger.error(f"ads_mcp.create_keyword failed: {error_detail}")
+        utils.logger.error("ads_mcp.create_keyword failed: %s", error_detail)
         return {
             "success": False,
             "error": error_detail,
         }
     except Exception as ex:
-        utils.logger.error(f"ads_mcp.create_keyword unexpected error: {ex}")
+        utils.logger.error("ads_mcp.create_keyword unexpected error: %s", ex)
         return {
             "success": False,
             "error": str(ex),
         }
 
 
+# Budget resource names of campaigns, keyed by (customer_id, campaign_id), so
+# that repeated budget updates skip the lookup query. Entries expire so that
+# budgets reassigned outside this server are eventually picked up.
+_BUDGET_CACHE_TTL_SECONDS = 300
+_BUDGET_CACHE_MAX_SIZE = 10000
+_budget_resource_names: Dict[Tuple[str, str], Tuple[float, str]] = {}
+_budget_resource_names_lock = threading.Lock()
+
+
+def _cache_budget_resource_name(
+    customer_id: str, campaign_id: str, budget_resource_name: str
+) -> None:
+    """Remembers the budget of a campaign for _BUDGET_CACHE_TTL_SECONDS."""
+    key = (customer_id, campaign_id)
+    now = time.monotonic()
+    with _budget_resource_names_lock:
+        # Entries are re-inserted on refresh, so the dict stays ordered by
+        # expiry and the oldest entries come first
+        refreshed = _budget_resource_names.pop(key, None) is not None
+        if not refreshed:
+            while _budget_resource_names:
+                oldest = next(iter(_budget_resource_names))
+                if _budget_resource_names[oldest][0] > now:
+                    break
+                del _budget_resource_names[oldest]
+            if len(_budget_resource_names) >= _BUDGET_CACHE_MAX_SIZE:
+                del _budget_resource_names[next(iter(_budget_resource_names))]
+        _budget_resource_names[key] = (
+            now + _BUDGET_CACHE_TTL_SECONDS,
+            budget_resource_name,
+        )
+
+
+def _forget_budget_resource_name(customer_id: str, campaign_id: str) -> None:
+    with _budget_resource_names_lock:
+        _budget_resource_names.pop((customer_id, campaign_id), None)
+
+
+def _get_budget_resource_name(
+    ga_service, customer_id: str, campaign_id: str
+) -> Optional[str]:
+    """Returns the resource name of a campaign's budget, or None if not found."""
+    with _budget_resource_names_lock:
+        cached = _budget_resource_names.get((customer_id, campaign_id))
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    query = f"""
+        SELECT campaign.campaign_budget
+        FROM campaign
+        WHERE campaign.id = {campaign_id}
+        LIMIT 1
+    """
+    # A unary search avoids setting up a server stream for a single row
+    row = next(iter(ga_service.search(customer_id=customer_id, query=query)), None)
+    budget_resource_name = row.campaign.campaign_budget if row else None
+
+    if budget_resource_name:
+        _cache_budget_resource_name(customer_id, campaign_id, budget_resource_name)
+    return budget_resource_name
+
+
 @mcp.tool()
 def update_campaign(
     customer_id: str,
@@ -417,6 +1205,7 @@ def update_campaign(
     status: Optional[str] = None,
     name: Optional[str] = None,
     budget_amount_micros: Optional[int] = None,
+    budget_resource_name: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Updates an existing campaign's settings.
 
@@ -428,13 +1217,22 @@ def update_campaign(
         name: New name for the campaign
         budget_amount_micros: New daily budget in micros. Note: This updates the
             campaign's budget resource. If the budget is shared with other campaigns,
-            all campaigns using that budget will be affected.
+            all campaigns using that budget will be affected. The campaign's budget
+            is remembered for up to 5 minutes after it is created or looked up, so
+            if the campaign was moved to another budget within that time, the
+            previous budget is updated instead. Pass budget_resource_name to
+            control which budget is changed.
+        budget_resource_name: Optional resource name of the campaign's budget
+            (e.g. 'customers/1234567890/campaignBudgets/111'). Only used with
+            budget_amount_micros; when provided, the budget is not looked up.
 
     Returns:
         Dict containing:
             - success: bool indicating if operation succeeded
             - campaign_resource_name: The resource name of the updated campaign
-            - budget_updated: bool indicating if budget was updated
+            - budget_updated: bool indicating if budget was updated. The budget
+              and campaign changes are applied independently, so this may be
+              True even if the campaign update failed.
             - error: Error message if operation failed
     """
     try:
@@ -444,34 +1242,51 @@ def update_campaign(
                 "error": "At least one field to update must be provided (status, name, or budget_amount_micros)",
             }
 
-        ga_service = utils.get_googleads_service("GoogleAdsService")
+        validation_error = (
+            _validate_customer_id(customer_id)
+            or _validate_id(campaign_id, "campaign_id")
+            or _validate_micros(budget_amount_micros, "budget_amount_micros")
+            or (
+                _validate_choice(
+                    status, _get_enum_values("CampaignStatusEnum"), "status"
+                )
+                if status is not None
+                else None
+            )
+            or (
+                _validate_resource_name(
+                    budget_resource_name,
+                    customer_id,
+                    "campaignBudgets",
+                    "budget_resource_name",
+                )
+                if budget_resource_name is not None
+                else None
+            )
+        )
+        if validation_error:
+            return {
+                "success": False,
+                "error": validation_error,
+            }
+
+        ga_service = _get_ga_service()
+        campaign_resource_name = _CAMPAIGN_RESOURCE_NAME(customer_id, campaign_id)
 
         mutate_operations = []
         budget_updated = False
 
         # Handle budget update if requested
         if budget_amount_micros is not None:
-            # First, we need to fetch the current campaign's budget resource name
-            search_service = utils.get_googleads_service("GoogleAdsService")
-            query = f"""
-                SELECT campaign.campaign_budget
-                FROM campaign
-                WHERE campaign.id = {campaign_id}
-            """
-            search_result = search_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-
-            budget_resource_name = None
-            for batch in search_result:
-                for row in batch.results:
-                    budget_resource_name = row.campaign.campaign_budget
-                    break
-                break
+            # Look up the campaign's budget unless the caller already knows it
+            if budget_resource_name is None:
+                budget_resource_name = _get_budget_resource_name(
+                    ga_service, customer_id, campaign_id
+                )
 
             if budget_resource_name:
                 # Create budget update operation
-                budget_operation = utils.get_googleads_type("MutateOperation")
+                budget_operation = _acquire_operation()
                 budget_update = budget_operation.campaign_budget_operation.update
                 budget_update.resource_name = budget_resource_name
                 budget_update.amount_micros = budget_amount_micros
@@ -484,16 +1299,14 @@ def update_campaign(
 
         # Handle campaign field updates
         if status is not None or name is not None:
-            campaign_status_enum = utils.get_googleads_type("CampaignStatusEnum").CampaignStatus
-
-            campaign_operation = utils.get_googleads_type("MutateOperation")
+            campaign_operation = _acquire_operation()
             campaign_update = campaign_operation.campaign_operation.update
-            campaign_update.resource_name = f"customers/{customer_id}/campaigns/{campaign_id}"
+            campaign_update.resource_name = campaign_resource_name
 
             update_mask_paths = []
 
             if status is not None:
-                campaign_update.status = getattr(campaign_status_enum, status)
+                campaign_update.status = _get_enum_value("CampaignStatusEnum", status)
                 update_mask_paths.append("status")
 
             if name is not None:
@@ -501,8 +1314,7 @@ def update_campaign(
                 update_mask_paths.append("name")
 
             # Set the field mask
-            for path in update_mask_paths:
-                campaign_operation.campaign_operation.update_mask.paths.append(path)
+            campaign_operation.campaign_operation.update_mask.paths.extend(update_mask_paths)
 
             mutate_operations.append(campaign_operation)
 
@@ -513,33 +1325,889 @@ def update_campaign(
             }
 
         utils.logger.info(
-            f"ads_mcp.update_campaign: Updating campaign {campaign_id}"
+            "ads_mcp.update_campaign: Updating campaign %s",
+            campaign_id,
         )
 
-        response = ga_service.mutate(
-            customer_id=customer_id,
-            mutate_operations=mutate_operations,
+        response = _mutate(ga_service, customer_id, mutate_operations)
+
+        # The budget operation, when present, is always the first operation
+        located_errors, unlocated_errors = _split_partial_failure_errors(response)
+        partial_failure_errors = _join_partial_failure_errors(
+            located_errors, unlocated_errors
         )
+        # Unlocated errors are reported under index 0 as well, but can't be
+        # attributed to the budget
+        if budget_updated and 0 in located_errors:
+            budget_updated = False
+            # The cached budget may be stale, look it up again next time
+            _forget_budget_resource_name(customer_id, campaign_id)
+
+        if partial_failure_errors:
+            error_detail = "; ".join(partial_failure_errors.values())
+            utils.logger.error("ads_mcp.update_campaign failed: %s", error_detail)
+            return {
+                "success": False,
+                "campaign_resource_name": campaign_resource_name,
+                "budget_updated": budget_updated,
+                "error": error_detail,
+            }
 
         utils.logger.info(
-            f"ads_mcp.update_campaign: Successfully updated campaign {campaign_id}"
+            "ads_mcp.update_campaign: Successfully updated campaign %s",
+            campaign_id,
         )
 
         return {
             "success": True,
-            "campaign_resource_name": f"customers/{customer_id}/campaigns/{campaign_id}",
+            "campaign_resource_name": campaign_resource_name,
             "budget_updated": budget_updated,
         }
 
     except GoogleAdsException as ex:
         error_detail = _extract_error_details(ex)
-        utils.logger.error(f"ads_mcp.update_campaign failed: {error_detail}")
+        utils.logger.error("ads_mcp.update_campaign failed: %s", error_detail)
+        return {
+            "success": False,
+            "error": error_detail,
+        }
+    except Exception as ex:
+        utils.logger.error("ads_mcp.update_campaign unexpected error: %s", ex)
+        return {
+            "success": False,
+            "error": str(ex),
+        }
+
+
+@mcp.tool()
+def create_ad_groups_bulk(
+    customer_id: str,
+    campaign_id: str,
+    ad_groups: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Creates multiple ad groups within an existing campaign in batched requests.
+
+    Prefer this over repeated calls to create_ad_group: all ad groups are sent
+    in as few requests as possible (up to 1,000 operations per request).
+
+    Args:
+        customer_id: The Google Ads customer ID (without hyphens)
+        campaign_id: The ID of the campaign to add the ad groups to
+        ad_groups: List of ad group specifications. Each entry is a dict with:
+            - name: The name of the ad group (required)
+            - cpc_bid_micros: Default max CPC bid in micros. Defaults to 1,000,000.
+            - status: ENABLED, PAUSED, or REMOVED. Defaults to ENABLED.
+
+    Returns:
+        Dict containing:
+            - success: bool indicating if all ad groups were created
+            - ad_group_resource_names: Resource names of the created ad groups,
+              in the same order as the input. Failed entries are empty strings.
+            - ad_group_ids: The IDs of the created ad groups, in the same order
+            - failed_operations: List of {"index", "error"} dicts describing
+              each entry that could not be created
+            - error: Error message if operation failed. If one of the requests
+              failed outright, the entries created by earlier requests are
+              still returned.
+    """
+    try:
+        if not ad_groups:
+            return {
+                "success": False,
+                "error": "At least one ad group must be provided",
+            }
+
+        validation_error = (
+            _validate_customer_id(customer_id)
+            or _validate_id(campaign_id, "campaign_id")
+            or _validate_specs(ad_groups, _validate_ad_group_spec, "Ad group")
+        )
+        if validation_error:
+            return {
+                "success": False,
+                "error": validation_error,
+            }
+
+        ga_service = _get_ga_service()
+
+        campaign_resource_name = _CAMPAIGN_RESOURCE_NAME(customer_id, campaign_id)
+        mutate_operations = [
+            _build_ad_group_operation(
+                campaign_resource_name,
+                ad_group["name"],
+                ad_group.get("cpc_bid_micros", 1000000),
+                ad_group.get("status", "ENABLED"),
+            )
+            for ad_group in ad_groups
+        ]
+
+        utils.logger.info(
+            "ads_mcp.create_ad_groups_bulk: Creating %d ad groups in campaign %s",
+            len(mutate_operations),
+            campaign_id,
+        )
+
+        resource_names, errors, request_error = _mutate_in_batches(
+            ga_service, customer_id, mutate_operations, "ad_group_result"
+        )
+
+        utils.logger.info(
+            "ads_mcp.create_ad_groups_bulk: Processed %d ad groups, %d failed",
+            len(mutate_operations),
+            len(errors),
+        )
+
+        result = {
+            "success": not errors,
+            "ad_group_resource_names": resource_names,
+            "ad_group_ids": [
+                resource_name.rsplit("/", 1)[-1] for resource_name in resource_names
+            ],
+            "failed_operations": [
+                {"index": index, "error": error}
+                for index, error in sorted(errors.items())
+            ],
+        }
+        if request_error:
+            result["error"] = request_error
+        return result
+
+    except GoogleAdsException as ex:
+        error_detail = _extract_error_details(ex)
+        utils.logger.error("ads_mcp.create_ad_groups_bulk failed: %s", error_detail)
+        return {
+            "success": False,
+            "error": error_detail,
+        }
+    except Exception as ex:
+        utils.logger.error("ads_mcp.create_ad_groups_bulk unexpected error: %s", ex)
+        return {
+            "success": False,
+            "error": str(ex),
+        }
+
+
+@mcp.tool()
+def create_responsive_search_ads_bulk(
+    customer_id: str,
+    ad_group_id: str,
+    ads: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Creates multiple responsive search ads in an ad group in batched requests.
+
+    Prefer this over repeated calls to create_responsive_search_ad: all ads are
+    sent in as few requests as possible (up to 1,000 operations per request).
+
+    Args:
+        customer_id: The Google Ads customer ID (without hyphens)
+        ad_group_id: The ID of the ad group to add the ads to
+        ads: List of ad specifications. Each entry is a dict with:
+            - headlines: List of 3-15 headline texts (required)
+            - descriptions: List of 2-4 description texts (required)
+            - final_urls: List of final URLs (required)
+            - path1: Optional first display URL path
+            - path2: Optional second display URL path
+
+    Returns:
+        Dict containing:
+            - success: bool indicating if all ads were created
+            - ad_group_ad_resource_names: Resource names of the created ads, in
+              the same order as the input. Failed entries are empty strings.
+            - failed_operations: List of {"index", "error"} dicts describing
+              each entry that could not be created
+            - error: Error message if operation failed. If one of the requests
+              failed outright, the entries created by earlier requests are
+              still returned.
+    """
+    try:
+        if not ads:
+            return {
+                "success": False,
+                "error": "At least one ad must be provided",
+            }
+
+        validation_error = (
+            _validate_customer_id(customer_id)
+            or _validate_id(ad_group_id, "ad_group_id")
+            or _validate_specs(ads, _validate_responsive_search_ad_spec, "Ad")
+        )
+        if validation_error:
+            return {
+                "success": False,
+                "error": validation_error,
+            }
+
+        ga_service = _get_ga_service()
+
+        ad_group_resource_name = _AD_GROUP_RESOURCE_NAME(customer_id, ad_group_id)
+        mutate_operations = [
+            _build_responsive_search_ad_operation(
+                ad_group_resource_name,
+                ad["headlines"],
+                ad["descriptions"],
+                ad["final_urls"],
+                ad.get("path1"),
+                ad.get("path2"),
+            )
+            for ad in ads
+        ]
+
+        utils.logger.info(
+            "ads_mcp.create_responsive_search_ads_bulk: Creating %d RSAs in ad group %s",
+            len(mutate_operations),
+            ad_group_id,
+        )
+
+        resource_names, errors, request_error = _mutate_in_batches(
+            ga_service, customer_id, mutate_operations, "ad_group_ad_result"
+        )
+
+        utils.logger.info(
+            "ads_mcp.create_responsive_search_ads_bulk: Processed %d RSAs, %d failed",
+            len(mutate_operations),
+            len(errors),
+        )
+
+        result = {
+            "success": not errors,
+            "ad_group_ad_resource_names": resource_names,
+            "failed_operations": [
+                {"index": index, "error": error}
+                for index, error in sorted(errors.items())
+            ],
+        }
+        if request_error:
+            result["error"] = request_error
+        return result
+
+    except GoogleAdsException as ex:
+        error_detail = _extract_error_details(ex)
+        utils.logger.error("ads_mcp.create_responsive_search_ads_bulk failed: %s", error_detail)
+        return {
+            "success": False,
+            "error": error_detail,
+        }
+    except Exception as ex:
+        utils.logger.error("ads_mcp.create_responsive_search_ads_bulk unexpected error: %s", ex)
+        return {
+            "success": False,
+            "error": str(ex),
+        }
+
+
+@mcp.tool()
+def create_keywords_bulk(
+    customer_id: str,
+    ad_group_id: str,
+    keywords: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Creates multiple keyword criteria in an ad group in batched requests.
+
+    Prefer this over repeated calls to create_keyword: all keywords are sent in
+    as few requests as possible (up to 1,000 operations per request).
+
+    Args:
+        customer_id: The Google Ads customer ID (without hyphens)
+        ad_group_id: The ID of the ad group to add the keywords to
+        keywords: List of keyword specifications. Each entry is a dict with:
+            - text: The keyword text (required)
+            - match_type: BROAD, PHRASE, or EXACT. Defaults to BROAD.
+            - cpc_bid_micros: Optional CPC bid in micros. If not set, the ad
+              group's default bid is used.
+
+    Returns:
+        Dict containing:
+            - success: bool indicating if all keywords were created
+            - ad_group_criterion_resource_names: Resource names of the created
+              keywords, in the same order as the input. Failed entries are
+              empty strings.
+            - failed_operations: List of {"index", "error"} dicts describing
+              each entry that could not be created
+            - error: Error message if operation failed. If one of the requests
+              failed outright, the entries created by earlier requests are
+              still returned.
+    """
+    try:
+        if not keywords:
+            return {
+                "success": False,
+                "error": "At least one keyword must be provided",
+            }
+
+        validation_error = (
+            _validate_customer_id(customer_id)
+            or _validate_id(ad_group_id, "ad_group_id")
+            or _validate_specs(keywords, _validate_keyword_spec, "Keyword")
+        )
+        if validation_error:
+            return {
+                "success": False,
+                "error": validation_error,
+            }
+
+        ga_service = _get_ga_service()
+
+        ad_group_resource_name = _AD_GROUP_RESOURCE_NAME(customer_id, ad_group_id)
+        mutate_operations = [
+            _build_keyword_operation(
+                ad_group_resource_name,
+                keyword["text"],
+                keyword.get("match_type", "BROAD"),
+                keyword.get("cpc_bid_micros"),
+            )
+            for keyword in keywords
+        ]
+
+        utils.logger.info(
+            "ads_mcp.create_keywords_bulk: Creating %d keywords in ad group %s",
+            len(mutate_operations),
+            ad_group_id,
+        )
+
+        resource_names, errors, request_error = _mutate_in_batches(
+            ga_service, customer_id, mutate_operations, "ad_group_criterion_result"
+        )
+
+        utils.logger.info(
+            "ads_mcp.create_keywords_bulk: Processed %d keywords, %d failed",
+            len(mutate_operations),
+            len(errors),
+        )
+
+        result = {
+            "success": not errors,
+            "ad_group_criterion_resource_names": resource_names,
+            "failed_operations": [
+                {"index": index, "error": error}
+                for index, error in sorted(errors.items())
+            ],
+        }
+        if request_error:
+            result["error"] = request_error
+        return result
+
+    except GoogleAdsException as ex:
+        error_detail = _extract_error_details(ex)
+        utils.logger.error("ads_mcp.create_keywords_bulk failed: %s", error_detail)
+        return {
+            "success": False,
+            "error": error_detail,
+        }
+    except Exception as ex:
+        utils.logger.error("ads_mcp.create_keywords_bulk unexpected error: %s", ex)
+        return {
+            "success": False,
+            "error": str(ex),
+        }
+
+
+def _validate_structure(
+    customer_id: str, campaign: Dict[str, Any], ad_groups: List[Dict[str, Any]]
+) -> Optional[str]:
+    """Validates the input of create_campaign_with_structure."""
+    validation_error = _validate_customer_id(customer_id) or _validate_campaign(
+        campaign.get("name"),
+        campaign.get("budget_amount_micros"),
+        campaign.get("advertising_channel_type", "SEARCH"),
+        campaign.get("status", "PAUSED"),
+        campaign.get("budget_delivery_method", "STANDARD"),
+    )
+    if validation_error:
+        return validation_error
+
+    for ad_group_index, ad_group in enumerate(ad_groups):
+        validation_error = (
+            _validate_ad_group_spec(ad_group)
+            or _validate_specs(
+                ad_group.get("responsive_search_ads", []),
+                _validate_responsive_search_ad_spec,
+                "Ad",
+            )
+            or _validate_specs(
+                ad_group.get("keywords", []), _validate_keyword_spec, "Keyword"
+            )
+        )
+        if validation_error:
+            return f"Ad group {ad_group_index}: {validation_error}"
+    return None
+
+
+@mcp.tool()
+def create_campaign_with_structure(
+    customer_id: str,
+    campaign: Dict[str, Any],
+    ad_groups: List[Dict[str, Any]],
+    atomic: bool = True,
+) -> Dict[str, Any]:
+    """Creates a campaign with its budget, ad groups, ads and keywords in a single request.
+
+    Prefer this over calling create_campaign, create_ad_group,
+    create_responsive_search_ad and create_keyword one after the other: the
+    new resources reference each other through temporary IDs, so everything
+    is created in one round trip.
+
+    Args:
+        customer_id: The Google Ads customer ID (without hyphens)
+        campaign: The campaign specification, a dict with:
+            - name: The name of the campaign (required)
+            - budget_amount_micros: Daily budget in micros (required)
+            - advertising_channel_type: Defaults to SEARCH.
+            - status: ENABLED, PAUSED, or REMOVED. Defaults to PAUSED.
+            - budget_delivery_method: STANDARD or ACCELERATED. Defaults to STANDARD.
+        ad_groups: List of ad group specifications. Each entry is a dict with:
+            - name: The name of the ad group (required)
+            - cpc_bid_micros: Default max CPC bid in micros. Defaults to 1,000,000.
+            - status: ENABLED, PAUSED, or REMOVED. Defaults to ENABLED.
+            - responsive_search_ads: Optional list of ads, in the format used by
+              create_responsive_search_ads_bulk.
+            - keywords: Optional list of keywords, in the format used by
+              create_keywords_bulk.
+        atomic: If True (the default), nothing is created unless every
+            operation succeeds. If False, the operations that succeed are
+            created even if others fail. A failed campaign or ad group then
+            leaves the budget, and any ad groups, ads and keywords that were
+            created, in the account; they are not removed automatically.
+
+    Returns:
+        Dict containing:
+            - success: bool indicating if everything was created
+            - campaign_resource_name: The resource name of the created campaign
+            - campaign_id: The ID of the created campaign
+            - budget_resource_name: The resource name of the created budget
+            - ad_groups: One dict per input ad group, in input order, with
+              ad_group_resource_name, ad_group_ad_resource_names and
+              ad_group_criterion_resource_names. Failed entries are empty strings.
+            - failed_operations: List of {"index", "error"} dicts. Operations are
+              numbered in request order: the budget, the campaign, then for each
+              ad group the ad group itself, its ads and its keywords. Only
+              returned when atomic is False.
+            - error: Error message if operation failed
+    """
+    try:
+        validation_error = _validate_structure(customer_id, campaign, ad_groups)
+        if validation_error:
+            return {
+                "success": False,
+                "error": validation_error,
+            }
+
+        operation_count = 2 + sum(
+            1
+            + len(ad_group.get("responsive_search_ads", []))
+            + len(ad_group.get("keywords", []))
+            for ad_group in ad_groups
+        )
+        if operation_count > _MUTATE_MAX_OPERATIONS:
+            return {
+                "success": False,
+                "error": (
+                    f"The structure needs {operation_count} operations, more "
+                    f"than the {_MUTATE_MAX_OPERATIONS} allowed in one request"
+                ),
+            }
+
+        ga_service = _get_ga_service()
+
+        # Temporary (negative) IDs let later operations reference resources
+        # created earlier in the same request.
+        name = campaign["name"]
+        temp_budget_resource_name = _CAMPAIGN_BUDGET_RESOURCE_NAME(
+            customer_id, -1
+        )
+        temp_campaign_resource_name = _CAMPAIGN_RESOURCE_NAME(customer_id, -2)
+
+        mutate_operations = [
+            _build_campaign_budget_operation(
+                temp_budget_resource_name,
+                f"{name} Budget",
+                campaign["budget_amount_micros"],
+                campaign.get("budget_delivery_method", "STANDARD"),
+            ),
+            _build_campaign_operation(
+                temp_budget_resource_name,
+                name,
+                campaign.get("advertising_channel_type", "SEARCH"),
+                campaign.get("status", "PAUSED"),
+                campaign_resource_name=temp_campaign_resource_name,
+            ),
+        ]
+
+        # Positions of each ad group's operations: (ad group, first ad,
+        # first keyword, end)
+        ad_group_layouts = []
+        for ad_group_index, ad_group in enumerate(ad_groups):
+            temp_ad_group_resource_name = _AD_GROUP_RESOURCE_NAME(
+                customer_id, -3 - ad_group_index
+            )
+
+            ad_group_start = len(mutate_operations)
+            mutate_operations.append(
+                _build_ad_group_operation(
+                    temp_campaign_resource_name,
+                    ad_group["name"],
+                    ad_group.get("cpc_bid_micros", 1000000),
+                    ad_group.get("status", "ENABLED"),
+                    ad_group_resource_name=temp_ad_group_resource_name,
+                )
+            )
+
+            ads_start = len(mutate_operations)
+            mutate_operations.extend(
+                _build_responsive_search_ad_operation(
+                    temp_ad_group_resource_name,
+                    ad["headlines"],
+                    ad["descriptions"],
+                    ad["final_urls"],
+                    ad.get("path1"),
+                    ad.get("path2"),
+                )
+                for ad in ad_group.get("responsive_search_ads", [])
+            )
+
+            keywords_start = len(mutate_operations)
+            mutate_operations.extend(
+                _build_keyword_operation(
+                    temp_ad_group_resource_name,
+                    keyword["text"],
+                    keyword.get("match_type", "BROAD"),
+                    keyword.get("cpc_bid_micros"),
+                )
+                for keyword in ad_group.get("keywords", [])
+            )
+
+            ad_group_layouts.append(
+                (
+                    ad_group_start,
+                    ads_start,
+                    keywords_start,
+                    len(mutate_operations),
+                )
+            )
+
+        utils.logger.info(
+            "ads_mcp.create_campaign_with_structure: Creating campaign '%s' "
+            "with %d operations for customer %s",
+            name,
+            len(mutate_operations),
+            customer_id,
+        )
+
+        response = _mutate(
+            ga_service,
+            customer_id,
+            mutate_operations,
+            partial_failure=not atomic,
+        )
+        partial_failure_errors = _get_partial_failure_errors(response)
+
+        operation_responses = response.mutate_operation_responses
+        budget_result = operation_responses[0].campaign_budget_result
+        budget_resource_name = budget_result.resource_name
+        campaign_result = operation_responses[1].campaign_result
+        campaign_resource_name = campaign_result.resource_name
+        campaign_id = campaign_resource_name.rsplit("/", 1)[-1]
+
+        ad_group_results = [
+            {
+                "ad_group_resource_name": operation_responses[
+                    start
+                ].ad_group_result.resource_name,
+                "ad_group_ad_resource_names": [
+                    operation_response.ad_group_ad_result.resource_name
+                    for operation_response in operation_responses[
+                        ads_start:keywords_start
+                    ]
+                ],
+                "ad_group_criterion_resource_names": [
+                    operation_response.ad_group_criterion_result.resource_name
+                    for operation_response in operation_responses[
+                        keywords_start:end
+                    ]
+                ],
+            }
+            for start, ads_start, keywords_start, end in ad_group_layouts
+        ]
+
+        if campaign_id:
+            _cache_budget_resource_name(
+                customer_id, campaign_id, budget_resource_name
+            )
+
+        utils.logger.info(
+            "ads_mcp.create_campaign_with_structure: Created campaign %s "
+            "with %d failed operations",
+            campaign_id or "(failed)",
+            len(partial_failure_errors),
+        )
+
+        result = {
+            "success": not partial_failure_errors,
+            "campaign_resource_name": campaign_resource_name,
+            "campaign_id": campaign_id,
+            "budget_resource_name": budget_resource_name,
+            "ad_groups": ad_group_results,
+        }
+        if not atomic:
+            result["failed_operations"] = [
+                {"index": index, "error": error}
+                for index, error in sorted(partial_failure_errors.items())
+            ]
+        return result
+
+    except GoogleAdsException as ex:
+        error_detail = _extract_error_details(ex)
+        utils.logger.error(
+            "ads_mcp.create_campaign_with_structure failed: %s", error_detail
+        )
+        return {
+            "success": False,
+            "error": error_detail,
+        }
+    except Exception as ex:
+        utils.logger.error(
+            "ads_mcp.create_campaign_with_structure unexpected error: %s", ex
+        )
+        return {
+            "success": False,
+            "error": str(ex),
+        }
+
+
+# Operations uploaded per AddBatchJobOperations call
+_BATCH_JOB_UPLOAD_SIZE = 5000
+# Results read per get_batch_job_status call
+_BATCH_JOB_RESULTS_PAGE_SIZE = 1000
+
+
+@mcp.tool()
+def create_keywords_via_batch_job(
+    customer_id: str,
+    keywords: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Creates keyword criteria asynchronously with a batch job.
+
+    Use this for very large numbers of keywords (tens of thousands or more),
+    possibly spread across many ad groups. The operations are uploaded to a
+    batch job that the Google Ads API runs in the background; this tool
+    returns as soon as the job has started. Check on the job with
+    get_batch_job_status. For smaller sets, create_keywords_bulk returns the
+    results directly.
+
+    Args:
+        customer_id: The Google Ads customer ID (without hyphens)
+        keywords: List of keyword specifications. Each entry is a dict with:
+            - ad_group_id: The ID of the ad group to add the keyword to (required)
+            - text: The keyword text (required)
+            - match_type: BROAD, PHRASE, or EXACT. Defaults to BROAD.
+            - cpc_bid_micros: Optional CPC bid in micros.
+
+    Returns:
+        Dict containing:
+            - success: bool indicating if the batch job was started
+            - batch_job_resource_name: The resource name of the batch job
+            - operation_count: The number of operations uploaded to the job
+            - error: Error message if operation failed. If the job was created
+              but the upload failed, batch_job_resource_name is still returned.
+    """
+    batch_job_resource_name = None
+    try:
+        if not keywords:
+            return {
+                "success": False,
+                "error": "At least one keyword must be provided",
+            }
+
+        validation_error = _validate_customer_id(customer_id) or _validate_specs(
+            keywords, _validate_batch_job_keyword_spec, "Keyword"
+        )
+        if validation_error:
+            return {
+                "success": False,
+                "error": validation_error,
+            }
+
+        batch_job_service = utils.get_googleads_service("BatchJobService")
+
+        # Create the batch job
+        batch_job_operation = _get_type("BatchJobOperation")
+        batch_job_operation.create.SetInParent()
+        batch_job_resource_name = batch_job_service.mutate_batch_job(
+            customer_id=customer_id, operation=batch_job_operation
+        ).result.resource_name
+
+        utils.logger.info(
+            "ads_mcp.create_keywords_via_batch_job: Uploading %d keywords to %s",
+            len(keywords),
+            batch_job_resource_name,
+        )
+
+        # Upload the operations, building each chunk only when it is sent so
+        # that at most one chunk of messages is held at a time. Each upload
+        # must carry the token returned by the previous one.
+        ad_group_names = {}
+        sequence_token = None
+        for start in range(0, len(keywords), _BATCH_JOB_UPLOAD_SIZE):
+            chunk = []
+            for keyword in keywords[start:start + _BATCH_JOB_UPLOAD_SIZE]:
+                ad_group_id = keyword["ad_group_id"]
+                ad_group_name = ad_group_names.get(ad_group_id)
+                if ad_group_name is None:
+                    ad_group_name = _AD_GROUP_RESOURCE_NAME(
+                        customer_id, ad_group_id
+                    )
+                    ad_group_names[ad_group_id] = ad_group_name
+                chunk.append(
+                    _build_keyword_operation(
+                        ad_group_name,
+                        keyword["text"],
+                        keyword.get("match_type", "BROAD"),
+                        keyword.get("cpc_bid_micros"),
+                    )
+                )
+            sequence_token = batch_job_service.add_batch_job_operations(
+                resource_name=batch_job_resource_name,
+                sequence_token=sequence_token,
+                mutate_operations=chunk,
+            ).next_sequence_token
+            _release_operations(chunk)
+
+        # Start the job without waiting on the returned long-running operation
+        batch_job_service.run_batch_job(resource_name=batch_job_resource_name)
+
+        utils.logger.info(
+            "ads_mcp.create_keywords_via_batch_job: Started batch job %s",
+            batch_job_resource_name,
+        )
+
+        return {
+            "success": True,
+            "batch_job_resource_name": batch_job_resource_name,
+            "operation_count": len(keywords),
+        }
+
+    except GoogleAdsException as ex:
+        error_detail = _extract_error_details(ex)
+        utils.logger.error("ads_mcp.create_keywords_via_batch_job failed: %s", error_detail)
+        result = {
+            "success": False,
+            "error": error_detail,
+        }
+    except Exception as ex:
+        utils.logger.error("ads_mcp.create_keywords_via_batch_job unexpected error: %s", ex)
+        result = {
+            "success": False,
+            "error": str(ex),
+        }
+
+    # A job created before the failure is left unstarted; return its name so
+    # that it can be inspected
+    if batch_job_resource_name is not None:
+        result["batch_job_resource_name"] = batch_job_resource_name
+    return result
+
+
+@mcp.tool()
+def get_batch_job_status(
+    customer_id: str,
+    batch_job_resource_name: str,
+    page_token: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Returns the progress of a batch job, and its failed operations once it is done.
+
+    Args:
+        customer_id: The Google Ads customer ID (without hyphens)
+        batch_job_resource_name: The resource name returned by
+            create_keywords_via_batch_job
+        page_token: Optional next_page_token from a previous call, to list the
+            failed operations among the next page of results.
+
+    Returns:
+        Dict containing:
+            - success: bool indicating if the status could be fetched
+            - status: PENDING, RUNNING, or DONE
+            - operation_count: The number of operations in the job
+            - executed_operation_count: The number of operations executed so far
+            - estimated_completion_ratio: Progress between 0 and 1
+            - failed_operations: Once the job is DONE, a list of {"index", "error"}
+              dicts describing each failed operation among one page of up to
+              1,000 results
+            - next_page_token: Once the job is DONE, the token to pass as
+              page_token for the next page of results, or an empty string if
+              this was the last page
+            - error: Error message if operation failed
+    """
+    try:
+        validation_error = _validate_customer_id(customer_id) or _validate_resource_name(
+            batch_job_resource_name, customer_id, "batchJobs", "batch_job_resource_name"
+        )
+        if validation_error:
+            return {
+                "success": False,
+                "error": validation_error,
+            }
+
+        ga_service = _get_ga_service()
+
+        query = f"""
+            SELECT
+                batch_job.status,
+                batch_job.metadata.operation_count,
+                batch_job.metadata.executed_operation_count,
+                batch_job.metadata.estimated_completion_ratio
+            FROM batch_job
+            WHERE batch_job.resource_name = '{batch_job_resource_name}'
+        """
+        row = next(iter(ga_service.search(customer_id=customer_id, query=query)), None)
+        if row is None:
+            return {
+                "success": False,
+                "error": f"Batch job {batch_job_resource_name} not found",
+            }
+
+        batch_job = row.batch_job
+        status = _get_type("BatchJobStatusEnum").BatchJobStatus.Name(batch_job.status)
+        result = {
+            "success": True,
+            "status": status,
+            "operation_count": batch_job.metadata.operation_count,
+            "executed_operation_count": batch_job.metadata.executed_operation_count,
+            "estimated_completion_ratio": batch_job.metadata.estimated_completion_ratio,
+        }
+
+        if status == "DONE":
+            batch_job_service = utils.get_googleads_service("BatchJobService")
+            list_request = _get_type("ListBatchJobResultsRequest")
+            list_request.resource_name = batch_job_resource_name
+            list_request.page_size = _BATCH_JOB_RESULTS_PAGE_SIZE
+            if page_token:
+                list_request.page_token = page_token
+            # Only one page is read per call, so that jobs with millions of
+            # operations don't block the tool on a scan of all their results
+            page = next(
+                iter(
+                    batch_job_service.list_batch_job_results(
+                        request=list_request
+                    ).pages
+                )
+            )
+            result["failed_operations"] = [
+                {"index": job_result.operation_index, "error": job_result.status.message}
+                for job_result in page.results
+                if job_result.status.code
+            ]
+            result["next_page_token"] = page.next_page_token
+
+        return result
+
+    except GoogleAdsException as ex:
+        error_detail = _extract_error_details(ex)
+        utils.logger.error("ads_mcp.get_batch_job_status failed: %s", error_detail)
         return {
             "success": False,
             "error": error_detail,
         }
     except Exception as ex:
-        utils.logger.error(f"ads_mcp.update_campaign unexpected error: {ex}")
+        utils.logger.error("ads_mcp.get_batch_job_status unexpected error: %s", ex)
         return {
             "success": False,
             "error": str(ex),
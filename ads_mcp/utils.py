@@ -16,9 +16,11 @@
 
 """Common utilities used by the MCP server."""
 
-from typing import Any
+from typing import Any, Dict, Iterator
 import proto
+import itertools
 import logging
+import threading
 from google.ads.googleads.client import GoogleAdsClient
 from google.ads.googleads.v21.services.services.google_ads_service import (
     GoogleAdsServiceClient,
@@ -62,12 +64,15 @@ def _get_login_customer_id() -> str:
 
 
 def _get_googleads_client() -> GoogleAdsClient:
-    # Use this line if you have a google-ads.yaml file
+    # Use this line if you have a google-ads.yaml file, and set
+    # use_proto_plus: False in it since the mutation tools build raw protobuf
+    # messages
     # client = GoogleAdsClient.load_from_storage()
     client = GoogleAdsClient(
         credentials=_create_credentials(),
         developer_token=_get_developer_token(),
         login_customer_id=_get_login_customer_id(),
+        use_proto_plus=False,
     )
 
     return client
@@ -76,10 +81,31 @@ def _get_googleads_client() -> GoogleAdsClient:
 _googleads_client = _get_googleads_client()
 
 
+# Number of clients, each with its own gRPC channel, kept for every service.
+# Creating a service client opens a new channel, so clients are reused across
+# tool calls and handed out round-robin to spread concurrent calls.
+_SERVICE_POOL_SIZE = 4
+
+_service_pools: Dict[str, Iterator[GoogleAdsServiceClient]] = {}
+_service_pools_lock = threading.Lock()
+
+
 def get_googleads_service(serviceName: str) -> GoogleAdsServiceClient:
-    return _googleads_client.get_service(
-        serviceName, interceptors=[MCPHeaderInterceptor()]
-    )
+    pool = _service_pools.get(serviceName)
+    if pool is None:
+        with _service_pools_lock:
+            pool = _service_pools.get(serviceName)
+            if pool is None:
+                pool = itertools.cycle(
+                    [
+                        _googleads_client.get_service(
+                            serviceName, interceptors=[MCPHeaderInterceptor()]
+                        )
+                        for _ in range(_SERVICE_POOL_SIZE)
+                    ]
+                )
+                _service_pools[serviceName] = pool
+    return next(pool)
 
 
 def get_googleads_type(typeName: str):
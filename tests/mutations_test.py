@@ -0,0 +1,1211 @@
+# Copyright 2025 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test cases for the mutations module."""
+
+import asyncio
+import inspect
+from types import SimpleNamespace
+import unittest
+from unittest import mock
+
+from ads_mcp.tools import mutations
+
+
+def _make_response(resource_names, result_field="ad_group_result"):
+    """Returns a MutateGoogleAdsResponse-like object without failures."""
+    return SimpleNamespace(
+        mutate_operation_responses=[
+            SimpleNamespace(
+                **{result_field: SimpleNamespace(resource_name=name)}
+            )
+            for name in resource_names
+        ],
+        partial_failure_error=SimpleNamespace(code=0, details=[]),
+    )
+
+
+class _FakeGoogleAdsFailure:
+    """Stands in for GoogleAdsFailure; the detail values are already parsed."""
+
+    @staticmethod
+    def FromString(value):
+        return value
+
+
+def _make_error(message, index=None):
+    """Returns a GoogleAdsError-like object, located at index if given."""
+    field_path_elements = []
+    if index is not None:
+        field_path_elements.append(SimpleNamespace(index=index))
+    return SimpleNamespace(
+        error_code="error_code",
+        message=message,
+        location=SimpleNamespace(field_path_elements=field_path_elements),
+    )
+
+
+def _make_partial_failure_response(errors, message="Partial failure"):
+    """Returns a response whose partial_failure_error carries errors."""
+    return SimpleNamespace(
+        partial_failure_error=SimpleNamespace(
+            code=3,
+            message=message,
+            details=[SimpleNamespace(value=SimpleNamespace(errors=errors))],
+        )
+    )
+
+
+class TestMutateInBatches(unittest.TestCase):
+    """Test cases for _mutate_in_batches."""
+
+    def setUp(self):
+        self.sent_chunks = []
+        patcher = mock.patch.object(mutations, "_MUTATE_BATCH_SIZE", 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _fake_mutate(self, ga_service, customer_id, mutate_operations):
+        self.sent_chunks.append(list(mutate_operations))
+        return _make_response(f"name{op}" for op in mutate_operations)
+
+    def test_chunk_boundaries(self):
+        """Tests that operations are split into chunks of _MUTATE_BATCH_SIZE."""
+        with mock.patch.object(mutations, "_mutate", self._fake_mutate):
+            resource_names, errors, request_error = (
+                mutations._mutate_in_batches(
+                    None, "1234567890", [0, 1, 2, 3, 4], "ad_group_result"
+                )
+            )
+
+        self.assertEqual(self.sent_chunks, [[0, 1], [2, 3], [4]])
+        self.assertEqual(
+            resource_names, ["name0", "name1", "name2", "name3", "name4"]
+        )
+        self.assertEqual(errors, {})
+        self.assertIsNone(request_error)
+
+    def test_exact_multiple_of_batch_size(self):
+        """Tests that no empty request is sent after the last full chunk."""
+        with mock.patch.object(mutations, "_mutate", self._fake_mutate):
+            mutations._mutate_in_batches(
+                None, "1234567890", [0, 1, 2, 3], "ad_group_result"
+            )
+
+        self.assertEqual(self.sent_chunks, [[0, 1], [2, 3]])
+
+    def test_failed_request_keeps_earlier_chunks(self):
+        """Tests that a failed request reports its and all later operations."""
+
+        def fake_mutate(ga_service, customer_id, mutate_operations):
+            if mutate_operations[0] == 2:
+                raise RuntimeError("quota exceeded")
+            return self._fake_mutate(ga_service, customer_id, mutate_operations)
+
+        with mock.patch.object(mutations, "_mutate", fake_mutate):
+            resource_names, errors, request_error = (
+                mutations._mutate_in_batches(
+                    None, "1234567890", [0, 1, 2, 3, 4], "ad_group_result"
+                )
+            )
+
+        self.assertEqual(self.sent_chunks, [[0, 1]])
+        self.assertEqual(resource_names, ["name0", "name1", "", "", ""])
+        self.assertEqual(request_error, "quota exceeded")
+        self.assertEqual(sorted(errors), [2, 3, 4])
+        self.assertEqual(errors[2], "quota exceeded")
+        self.assertEqual(errors[3], "quota exceeded")
+        self.assertNotEqual(errors[4], "quota exceeded")
+
+
+class TestBulkTools(unittest.TestCase):
+    """End-to-end test cases for the *_bulk tools with _mutate patched.
+
+    Each builder returns a name that stands for its operation. Operations
+    whose name starts with "bad" fail with a partial failure error, and a
+    request whose first operation starts with "quota" fails outright.
+    """
+
+    def setUp(self):
+        self.sent_chunks = []
+        for name, value in (
+            ("_get_enum_values", _ENUM_VALUES.__getitem__),
+            ("_get_ga_service", mock.Mock()),
+            ("_get_type", mock.Mock(return_value=_FakeGoogleAdsFailure())),
+            ("_mutate", self._fake_mutate),
+            ("_build_ad_group_operation", lambda parent, name, *_: name),
+            (
+                "_build_responsive_search_ad_operation",
+                lambda parent, headlines, *_: headlines[0],
+            ),
+            ("_build_keyword_operation", lambda parent, text, *_: text),
+            ("_MUTATE_BATCH_SIZE", 2),
+        ):
+            patcher = mock.patch.object(mutations, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _fake_mutate(self, ga_service, customer_id, mutate_operations):
+        if mutate_operations[0].startswith("quota"):
+            raise RuntimeError("quota exceeded")
+        self.sent_chunks.append(list(mutate_operations))
+        failed = [
+            index
+            for index, operation in enumerate(mutate_operations)
+            if operation.startswith("bad")
+        ]
+        responses = []
+        for index, operation in enumerate(mutate_operations):
+            resource_name = f"customers/1234567890/x/{operation}"
+            result = SimpleNamespace(
+                resource_name="" if index in failed else resource_name
+            )
+            responses.append(
+                SimpleNamespace(
+                    ad_group_result=result,
+                    ad_group_ad_result=result,
+                    ad_group_criterion_result=result,
+                )
+            )
+        # The API doesn't order errors by operation, so report them reversed
+        errors = [
+            _make_error(f"{mutate_operations[index]} rejected", index=index)
+            for index in reversed(failed)
+        ]
+        response = _make_partial_failure_response(errors)
+        if not errors:
+            response.partial_failure_error.code = 0
+            response.partial_failure_error.details = []
+        response.mutate_operation_responses = responses
+        return response
+
+    def test_create_ad_groups_bulk(self):
+        """Tests resource names, IDs and sorted failures of ad groups."""
+        ad_groups = [
+            {"name": name} for name in ("bad0", "bad1", "12", "bad3", "14")
+        ]
+
+        result = mutations.create_ad_groups_bulk(
+            "1234567890", "1", ad_groups
+        )
+
+        self.assertEqual(
+            self.sent_chunks, [["bad0", "bad1"], ["12", "bad3"], ["14"]]
+        )
+        self.assertEqual(
+            result,
+            {
+                "success": False,
+                "ad_group_resource_names": [
+                    "",
+                    "",
+                    "customers/1234567890/x/12",
+                    "",
+                    "customers/1234567890/x/14",
+                ],
+                "ad_group_ids": ["", "", "12", "", "14"],
+                "failed_operations": [
+                    {"index": 0, "error": "error_code: bad0 rejected"},
+                    {"index": 1, "error": "error_code: bad1 rejected"},
+                    {"index": 3, "error": "error_code: bad3 rejected"},
+                ],
+            },
+        )
+
+    def test_create_responsive_search_ads_bulk_failed_request(self):
+        """Tests that a failed request is reported next to earlier results."""
+        ads = [
+            {
+                "headlines": [headline, "Headline 2", "Headline 3"],
+                "descriptions": ["Description 1", "Description 2"],
+                "final_urls": ["https://example.com"],
+            }
+            for headline in ("21", "22", "quota", "24")
+        ]
+
+        result = mutations.create_responsive_search_ads_bulk(
+            "1234567890", "1", ads
+        )
+
+        self.assertEqual(self.sent_chunks, [["21", "22"]])
+        self.assertFalse(result["success"])
+        self.assertEqual(result["error"], "quota exceeded")
+        self.assertEqual(
+            result["ad_group_ad_resource_names"],
+            [
+                "customers/1234567890/x/21",
+                "customers/1234567890/x/22",
+                "",
+                "",
+            ],
+        )
+        self.assertEqual(
+            [failure["index"] for failure in result["failed_operations"]],
+            [2, 3],
+        )
+
+    def test_create_keywords_bulk(self):
+        """Tests that a fully successful request reports no failures."""
+        keywords = [{"text": text} for text in ("31", "32", "33")]
+
+        result = mutations.create_keywords_bulk("1234567890", "1", keywords)
+
+        self.assertEqual(
+            result,
+            {
+                "success": True,
+                "ad_group_criterion_resource_names": [
+                    "customers/1234567890/x/31",
+                    "customers/1234567890/x/32",
+                    "customers/1234567890/x/33",
+                ],
+                "failed_operations": [],
+            },
+        )
+
+
+class TestGetPartialFailureErrors(unittest.TestCase):
+    """Test cases for _get_partial_failure_errors."""
+
+    def setUp(self):
+        patcher = mock.patch.object(
+            mutations, "_get_type", return_value=_FakeGoogleAdsFailure()
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_no_partial_failure(self):
+        """Tests that a response without a failure maps to no errors."""
+        self.assertEqual(
+            mutations._get_partial_failure_errors(_make_response([])), {}
+        )
+
+    def test_errors_are_mapped_to_operation_indexes(self):
+        """Tests that errors are grouped by the index of their operation."""
+        response = _make_partial_failure_response(
+            [
+                _make_error("first", index=0),
+                _make_error("second", index=2),
+                _make_error("third", index=2),
+            ]
+        )
+
+        self.assertEqual(
+            mutations._get_partial_failure_errors(response),
+            {
+                0: "error_code: first",
+                2: "error_code: second; error_code: third",
+            },
+        )
+
+    def test_offset_maps_chunk_indexes(self):
+        """Tests that indexes within a later chunk are shifted by the offset."""
+        response = _make_partial_failure_response(
+            [_make_error("failed", index=1)]
+        )
+
+        self.assertEqual(
+            mutations._get_partial_failure_errors(response, offset=1000),
+            {1001: "error_code: failed"},
+        )
+
+    def test_unmapped_errors_are_reported(self):
+        """Tests that errors without a location are not dropped."""
+        response = _make_partial_failure_response([_make_error("no location")])
+
+        self.assertEqual(
+            mutations._get_partial_failure_errors(response, offset=1000),
+            {1000: "error_code: no location"},
+        )
+
+    def test_unmapped_errors_are_kept_next_to_mapped_ones(self):
+        """Tests that unlocated errors are kept next to located ones."""
+        response = _make_partial_failure_response(
+            [_make_error("no location"), _make_error("failed", index=1)]
+        )
+
+        self.assertEqual(
+            mutations._get_partial_failure_errors(response),
+            {0: "error_code: no location", 1: "error_code: failed"},
+        )
+
+    def test_failure_without_errors_falls_back_to_message(self):
+        """Tests that a failure with no parsable errors uses its message."""
+        response = _make_partial_failure_response([], message="Request failed")
+
+        self.assertEqual(
+            mutations._get_partial_failure_errors(response),
+            {0: "Request failed"},
+        )
+
+
+class TestBudgetResourceNameCache(unittest.TestCase):
+    """Test cases for the campaign budget cache used by update_campaign."""
+
+    _BUDGET = "customers/1234567890/campaignBudgets/111"
+
+    def setUp(self):
+        mutations._budget_resource_names.clear()
+        self.addCleanup(mutations._budget_resource_names.clear)
+        self.ga_service = mock.Mock()
+        self.ga_service.search.return_value = [
+            SimpleNamespace(
+                campaign=SimpleNamespace(campaign_budget=self._BUDGET)
+            )
+        ]
+
+    def _get_budget(self, now, campaign_id="222"):
+        with mock.patch.object(mutations.time, "monotonic", return_value=now):
+            return mutations._get_budget_resource_name(
+                self.ga_service, "1234567890", campaign_id
+            )
+
+    def test_lookup_is_cached(self):
+        """Tests that a second lookup within the TTL doesn't query the API."""
+        self.assertEqual(self._get_budget(now=0), self._BUDGET)
+        self.assertEqual(
+            self._get_budget(now=mutations._BUDGET_CACHE_TTL_SECONDS - 1),
+            self._BUDGET,
+        )
+        self.assertEqual(self.ga_service.search.call_count, 1)
+
+    def test_entries_expire(self):
+        """Tests that the budget is looked up again once the TTL has passed."""
+        self._get_budget(now=0)
+        self._get_budget(now=mutations._BUDGET_CACHE_TTL_SECONDS)
+        self.assertEqual(self.ga_service.search.call_count, 2)
+
+    def test_forget_removes_entry(self):
+        """Tests that a forgotten budget is looked up again."""
+        self._get_budget(now=0)
+        mutations._forget_budget_resource_name("1234567890", "222")
+        self._get_budget(now=1)
+        self.assertEqual(self.ga_service.search.call_count, 2)
+
+    def test_oldest_entry_is_evicted(self):
+        """Tests that the cache drops its oldest entry when full."""
+        with mock.patch.object(mutations, "_BUDGET_CACHE_MAX_SIZE", 2):
+            for campaign_id in ("1", "2", "3"):
+                mutations._cache_budget_resource_name(
+                    "1234567890", campaign_id, self._BUDGET
+                )
+
+        self.assertEqual(
+            list(mutations._budget_resource_names),
+            [("1234567890", "2"), ("1234567890", "3")],
+        )
+
+    def _cache_budgets(self, now, campaign_ids):
+        with mock.patch.object(
+            mutations.time, "monotonic", return_value=now
+        ), mock.patch.object(mutations, "_BUDGET_CACHE_MAX_SIZE", 2):
+            for campaign_id in campaign_ids:
+                mutations._cache_budget_resource_name(
+                    "1234567890", campaign_id, self._BUDGET
+                )
+
+    def test_refreshing_a_cached_entry_evicts_nothing(self):
+        """Tests that re-caching a present key in a full cache keeps others."""
+        self._cache_budgets(now=0, campaign_ids=("1", "2"))
+        self._cache_budgets(now=1, campaign_ids=("1",))
+
+        self.assertEqual(
+            list(mutations._budget_resource_names),
+            [("1234567890", "2"), ("1234567890", "1")],
+        )
+
+    def test_expired_entries_are_dropped_before_live_ones(self):
+        """Tests that a full cache drops expired entries first."""
+        self._cache_budgets(now=0, campaign_ids=("1",))
+        self._cache_budgets(now=10, campaign_ids=("2",))
+        self._cache_budgets(
+            now=mutations._BUDGET_CACHE_TTL_SECONDS + 10, campaign_ids=("3",)
+        )
+
+        self.assertEqual(
+            list(mutations._budget_resource_names), [("1234567890", "3")]
+        )
+
+    def test_campaign_not_found(self):
+        """Tests that a missing campaign is neither found nor cached."""
+        self.ga_service.search.return_value = []
+        self.assertIsNone(self._get_budget(now=0))
+        self.assertEqual(mutations._budget_resource_names, {})
+
+
+def _make_operation(operation_field, action, value):
+    """Returns a MutateOperation-like object holding a single operation."""
+    operation = SimpleNamespace(WhichOneof=lambda _: action, **{action: value})
+    return SimpleNamespace(
+        WhichOneof=lambda _: operation_field, **{operation_field: operation}
+    )
+
+
+class TestGetLockedResourceName(unittest.TestCase):
+    """Test cases for _get_locked_resource_name."""
+
+    def test_update_locks_updated_resource(self):
+        """Tests that an update locks the resource it updates."""
+        operation = _make_operation(
+            "campaign_budget_operation",
+            "update",
+            SimpleNamespace(
+                resource_name="customers/1234567890/campaignBudgets/111"
+            ),
+        )
+        self.assertEqual(
+            mutations._get_locked_resource_name(operation),
+            "customers/1234567890/campaignBudgets/111",
+        )
+
+    def test_remove_locks_removed_resource(self):
+        """Tests that a remove locks the resource it removes."""
+        operation = _make_operation(
+            "campaign_operation", "remove", "customers/1234567890/campaigns/2"
+        )
+        self.assertEqual(
+            mutations._get_locked_resource_name(operation),
+            "customers/1234567890/campaigns/2",
+        )
+
+    def test_create_locks_parent(self):
+        """Tests that a create locks the resource it is created under."""
+        operation = _make_operation(
+            "ad_group_criterion_operation",
+            "create",
+            SimpleNamespace(ad_group="customers/1234567890/adGroups/3"),
+        )
+        self.assertEqual(
+            mutations._get_locked_resource_name(operation),
+            "customers/1234567890/adGroups/3",
+        )
+
+    def test_temporary_parent_is_not_locked(self):
+        """Tests that resources with temporary IDs are not locked."""
+        operation = _make_operation(
+            "ad_group_operation",
+            "create",
+            SimpleNamespace(campaign="customers/1234567890/campaigns/-2"),
+        )
+        self.assertIsNone(mutations._get_locked_resource_name(operation))
+
+    def test_create_without_parent_is_not_locked(self):
+        """Tests that creates of top-level resources are not locked."""
+        operation = _make_operation(
+            "campaign_budget_operation", "create", SimpleNamespace()
+        )
+        self.assertIsNone(mutations._get_locked_resource_name(operation))
+
+
+class TestGetBatchJobStatus(unittest.TestCase):
+    """Test cases for get_batch_job_status."""
+
+    @mock.patch.object(mutations, "_get_ga_service")
+    def test_rejects_foreign_or_malformed_resource_names(self, get_ga_service):
+        """Tests that only batch jobs of the given customer are queried."""
+        for resource_name in (
+            "customers/1234567890/batchJobs/1' OR batch_job.id > '0",
+            "customers/9999999999/batchJobs/1",
+            "customers/1234567890/campaigns/1",
+        ):
+            result = mutations.get_batch_job_status("1234567890", resource_name)
+            self.assertFalse(result["success"], resource_name)
+
+        get_ga_service.assert_not_called()
+
+
+class TestCreateKeywordsViaBatchJob(unittest.TestCase):
+    """Test cases for create_keywords_via_batch_job."""
+
+    _JOB = "customers/1234567890/batchJobs/1"
+
+    def setUp(self):
+        self.service = mock.Mock()
+        self.service.mutate_batch_job.return_value.result.resource_name = (
+            self._JOB
+        )
+        self.service.add_batch_job_operations.side_effect = [
+            SimpleNamespace(next_sequence_token=token)
+            for token in ("token-1", "token-2", "token-3")
+        ]
+        for name, value in (
+            ("_get_enum_values", _ENUM_VALUES.__getitem__),
+            ("_get_type", mock.Mock()),
+            ("_build_keyword_operation", lambda parent, text, *_: text),
+            ("_release_operations", mock.Mock()),
+            ("_BATCH_JOB_UPLOAD_SIZE", 2),
+        ):
+            patcher = mock.patch.object(mutations, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(
+            mutations.utils, "get_googleads_service", return_value=self.service
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_uploads_chain_sequence_tokens(self):
+        """Tests that each upload carries the token of the previous one."""
+        keywords = [
+            {"ad_group_id": "1", "text": f"keyword {i}"} for i in range(5)
+        ]
+
+        result = mutations.create_keywords_via_batch_job(
+            "1234567890", keywords
+        )
+
+        self.assertEqual(
+            result,
+            {
+                "success": True,
+                "batch_job_resource_name": self._JOB,
+                "operation_count": 5,
+            },
+        )
+        calls = self.service.add_batch_job_operations.call_args_list
+        self.assertEqual(
+            [call.kwargs["sequence_token"] for call in calls],
+            [None, "token-1", "token-2"],
+        )
+        self.assertEqual(
+            [call.kwargs["mutate_operations"] for call in calls],
+            [
+                ["keyword 0", "keyword 1"],
+                ["keyword 2", "keyword 3"],
+                ["keyword 4"],
+            ],
+        )
+        self.service.run_batch_job.assert_called_once_with(
+            resource_name=self._JOB
+        )
+
+
+_ENUM_VALUES = {
+    "AdvertisingChannelTypeEnum": {"SEARCH": 2, "DISPLAY": 3},
+    "AdGroupStatusEnum": {"ENABLED": 2, "PAUSED": 3, "REMOVED": 4},
+    "BudgetDeliveryMethodEnum": {"STANDARD": 2, "ACCELERATED": 3},
+    "CampaignStatusEnum": {"ENABLED": 2, "PAUSED": 3, "REMOVED": 4},
+    "KeywordMatchTypeEnum": {"EXACT": 2, "PHRASE": 3, "BROAD": 4},
+}
+
+
+class TestValidation(unittest.TestCase):
+    """Test cases for the _validate_* helpers."""
+
+    def setUp(self):
+        patcher = mock.patch.object(
+            mutations, "_get_enum_values", _ENUM_VALUES.__getitem__
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_validate_customer_id(self):
+        """Tests that customer IDs must be 10 digits without hyphens."""
+        self.assertIsNone(mutations._validate_customer_id("1234567890"))
+        self.assertIsNotNone(mutations._validate_customer_id("123-456-7890"))
+        self.assertIsNotNone(mutations._validate_customer_id("12345"))
+        self.assertIsNotNone(
+            mutations._validate_customer_id("１２３４５６７８９０")
+        )
+
+    def test_validate_id_rejects_non_ascii_digits(self):
+        """Tests that IDs must consist of ASCII digits only."""
+        self.assertIsNone(mutations._validate_id("123", "campaign_id"))
+        for value in ("²", "١٢٣", "12a", ""):
+            self.assertIsNotNone(
+                mutations._validate_id(value, "campaign_id"), value
+            )
+
+    def test_validate_id(self):
+        """Tests that resource IDs must be numeric."""
+        self.assertIsNone(mutations._validate_id("42", "campaign_id"))
+        self.assertIsNotNone(mutations._validate_id("42 OR 1=1", "campaign_id"))
+
+    def test_validate_resource_name(self):
+        """Tests that resource names must belong to the customer."""
+        self.assertIsNone(
+            mutations._validate_resource_name(
+                "customers/1234567890/campaignBudgets/111",
+                "1234567890",
+                "campaignBudgets",
+                "budget_resource_name",
+            )
+        )
+        for resource_name in (
+            "customers/9999999999/campaignBudgets/111",
+            "customers/1234567890/campaigns/111",
+            "customers/1234567890/campaignBudgets/111/extra",
+            "customers/1234567890/campaignBudgets/",
+        ):
+            self.assertIsNotNone(
+                mutations._validate_resource_name(
+                    resource_name,
+                    "1234567890",
+                    "campaignBudgets",
+                    "budget_resource_name",
+                ),
+                resource_name,
+            )
+
+    def test_validate_campaign(self):
+        """Tests campaign specifications."""
+        self.assertIsNone(
+            mutations._validate_campaign(
+                "Campaign", 1000000, "SEARCH", "PAUSED", "STANDARD"
+            )
+        )
+        self.assertIsNotNone(
+            mutations._validate_campaign(
+                "", 1000000, "SEARCH", "PAUSED", "STANDARD"
+            )
+        )
+        self.assertIsNotNone(
+            mutations._validate_campaign(
+                "Campaign", 0, "SEARCH", "PAUSED", "STANDARD"
+            )
+        )
+        self.assertIsNotNone(
+            mutations._validate_campaign(
+                "Campaign", 1000000, "SEARCH", "PAUSE", "STANDARD"
+            )
+        )
+        self.assertIsNotNone(
+            mutations._validate_campaign(
+                "Campaign", 1000000, "RADIO", "PAUSED", "STANDARD"
+            )
+        )
+
+    def test_validate_ad_group(self):
+        """Tests ad group specifications."""
+        validate = mutations._validate_ad_group
+        self.assertIsNone(validate("Ad group", 500000, "ENABLED"))
+        self.assertIsNotNone(validate(None, 500000, "ENABLED"))
+        self.assertIsNotNone(validate("Ad group", -1, "ENABLED"))
+        self.assertIsNotNone(validate("Ad group", 500000, "ON"))
+
+    def test_validate_keyword(self):
+        """Tests keyword specifications."""
+        validate = mutations._validate_keyword
+        self.assertIsNone(validate("running shoes", "EXACT", None))
+        self.assertIsNotNone(validate("", "EXACT", None))
+        self.assertIsNotNone(validate("x" * 81, "EXACT", None))
+        self.assertIsNotNone(validate("shoes", "exact", None))
+
+    def test_validate_responsive_search_ad(self):
+        """Tests responsive search ad specifications."""
+        headlines = ["Headline 1", "Headline 2", "Headline 3"]
+        descriptions = ["Description 1", "Description 2"]
+        final_urls = ["https://example.com"]
+
+        self.assertIsNone(
+            mutations._validate_responsive_search_ad(
+                headlines, descriptions, final_urls, "shoes", "sale"
+            )
+        )
+        self.assertIsNotNone(
+            mutations._validate_responsive_search_ad(
+                headlines[:2], descriptions, final_urls
+            )
+        )
+        self.assertIsNotNone(
+            mutations._validate_responsive_search_ad(
+                headlines, ["x" * 91, "Description 2"], final_urls
+            )
+        )
+        self.assertIsNotNone(
+            mutations._validate_responsive_search_ad(
+                headlines, descriptions, []
+            )
+        )
+        self.assertIsNotNone(
+            mutations._validate_responsive_search_ad(
+                headlines, descriptions, final_urls, None, "sale"
+            )
+        )
+
+    def test_validate_specs_reports_index(self):
+        """Tests that the first invalid spec is reported with its index."""
+        self.assertEqual(
+            mutations._validate_specs(
+                [{"text": "shoes"}, {"text": ""}],
+                mutations._validate_keyword_spec,
+                "Keyword",
+            ),
+            "Keyword 1: Keyword text is required",
+        )
+
+    @mock.patch.object(mutations, "_get_ga_service")
+    def test_update_campaign_rejects_foreign_budget(self, get_ga_service):
+        """Tests that update_campaign only updates budgets of the customer."""
+        result = mutations.update_campaign(
+            "1234567890",
+            "222",
+            budget_amount_micros=1000000,
+            budget_resource_name="customers/9999999999/campaignBudgets/111",
+        )
+
+        self.assertFalse(result["success"])
+        get_ga_service.assert_not_called()
+
+
+class TestCreateCampaignWithStructure(unittest.TestCase):
+    """Test cases for create_campaign_with_structure."""
+
+    _AD = {
+        "headlines": ["Headline 1", "Headline 2", "Headline 3"],
+        "descriptions": ["Description 1", "Description 2"],
+        "final_urls": ["https://example.com"],
+    }
+
+    def setUp(self):
+        self.sent_operations = []
+        for name, value in (
+            ("_get_enum_values", _ENUM_VALUES.__getitem__),
+            ("_get_ga_service", mock.Mock()),
+            ("_mutate", self._fake_mutate),
+            ("_build_campaign_budget_operation", self._builder("budget")),
+            ("_build_campaign_operation", self._builder("campaign")),
+            ("_build_ad_group_operation", self._builder("ad_group")),
+            ("_build_responsive_search_ad_operation", self._builder("ad")),
+            ("_build_keyword_operation", self._builder("keyword")),
+        ):
+            patcher = mock.patch.object(mutations, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(mutations._budget_resource_names.clear)
+
+    @staticmethod
+    def _builder(kind):
+        return lambda *args, **kwargs: kind
+
+    def _fake_mutate(
+        self, ga_service, customer_id, mutate_operations, partial_failure=True
+    ):
+        """Returns the operation's index as the ID of each created resource."""
+        self.sent_operations = list(mutate_operations)
+        self.partial_failure = partial_failure
+
+        def result(index):
+            return SimpleNamespace(
+                resource_name=f"customers/{customer_id}/resources/{index}"
+            )
+
+        return SimpleNamespace(
+            mutate_operation_responses=[
+                SimpleNamespace(
+                    campaign_budget_result=result(index),
+                    campaign_result=result(index),
+                    ad_group_result=result(index),
+                    ad_group_ad_result=result(index),
+                    ad_group_criterion_result=result(index),
+                )
+                for index in range(len(mutate_operations))
+            ],
+            partial_failure_error=SimpleNamespace(code=0, details=[]),
+        )
+
+    def test_index_layout(self):
+        """Tests that results are read from the position of each operation."""
+        result = mutations.create_campaign_with_structure(
+            "1234567890",
+            {"name": "Campaign", "budget_amount_micros": 1000000},
+            [
+                {
+                    "name": "Ad group 1",
+                    "responsive_search_ads": [self._AD],
+                    "keywords": [{"text": "shoes"}, {"text": "boots"}],
+                },
+                {"name": "Ad group 2", "keywords": [{"text": "socks"}]},
+            ],
+        )
+
+        self.assertEqual(
+            self.sent_operations,
+            [
+                "budget",
+                "campaign",
+                "ad_group",
+                "ad",
+                "keyword",
+                "keyword",
+                "ad_group",
+                "keyword",
+            ],
+        )
+        self.assertTrue(result["success"])
+        self.assertFalse(self.partial_failure)
+        self.assertNotIn("failed_operations", result)
+        self.assertEqual(result["campaign_id"], "1")
+        self.assertEqual(
+            result["budget_resource_name"],
+            "customers/1234567890/resources/0",
+        )
+
+        resource_ids = [
+            {
+                key: (
+                    value.rsplit("/", 1)[-1]
+                    if isinstance(value, str)
+                    else [name.rsplit("/", 1)[-1] for name in value]
+                )
+                for key, value in ad_group.items()
+            }
+            for ad_group in result["ad_groups"]
+        ]
+        self.assertEqual(
+            resource_ids,
+            [
+                {
+                    "ad_group_resource_name": "2",
+                    "ad_group_ad_resource_names": ["3"],
+                    "ad_group_criterion_resource_names": ["4", "5"],
+                },
+                {
+                    "ad_group_resource_name": "6",
+                    "ad_group_ad_resource_names": [],
+                    "ad_group_criterion_resource_names": ["7"],
+                },
+            ],
+        )
+
+    def test_non_atomic_request_reports_failed_operations(self):
+        """Tests that partial failure is only used when the caller opts in."""
+        result = mutations.create_campaign_with_structure(
+            "1234567890",
+            {"name": "Campaign", "budget_amount_micros": 1000000},
+            [{"name": "Ad group"}],
+            atomic=False,
+        )
+
+        self.assertTrue(self.partial_failure)
+        self.assertEqual(result["failed_operations"], [])
+
+    def test_first_invalid_ad_group_is_reported(self):
+        """Tests that validation stops at the first invalid ad group."""
+        result = mutations.create_campaign_with_structure(
+            "1234567890",
+            {"name": "Campaign", "budget_amount_micros": 1000000},
+            [
+                {"name": "Ad group"},
+                {"name": "Ad group", "keywords": [{"text": ""}]},
+                {"name": ""},
+            ],
+        )
+
+        self.assertEqual(
+            result,
+            {
+                "success": False,
+                "error": "Ad group 1: Keyword 0: Keyword text is required",
+            },
+        )
+        self.assertEqual(self.sent_operations, [])
+
+
+class TestCreateCampaign(unittest.TestCase):
+    """Test cases for create_campaign."""
+
+    _BUDGET = "customers/1234567890/campaignBudgets/1"
+
+    def setUp(self):
+        self.mutate = mock.Mock(
+            return_value=SimpleNamespace(
+                mutate_operation_responses=[
+                    SimpleNamespace(
+                        campaign_budget_result=SimpleNamespace(
+                            resource_name=self._BUDGET
+                        )
+                    ),
+                    SimpleNamespace(
+                        campaign_result=SimpleNamespace(
+                            resource_name="customers/1234567890/campaigns/2"
+                        )
+                    ),
+                ]
+            )
+        )
+        for name, value in (
+            ("_get_enum_values", _ENUM_VALUES.__getitem__),
+            ("_get_ga_service", mock.Mock()),
+            ("_mutate", self.mutate),
+            ("_build_campaign_budget_operation", mock.Mock()),
+            ("_build_campaign_operation", mock.Mock()),
+        ):
+            patcher = mock.patch.object(mutations, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(mutations._budget_resource_names.clear)
+
+    def test_budget_and_campaign_are_created_atomically(self):
+        """Tests that a failed campaign can't leave its budget behind."""
+        result = asyncio.run(
+            mutations.create_campaign("1234567890", "Campaign", 1000000)
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["campaign_id"], "2")
+        self.assertIs(self.mutate.call_args.kwargs["partial_failure"], False)
+
+    def test_create_tools_keep_their_signature(self):
+        """Tests that the non-blocking create tools keep their schema."""
+        self.assertTrue(inspect.iscoroutinefunction(mutations.create_campaign))
+        self.assertEqual(
+            list(inspect.signature(mutations.create_campaign).parameters),
+            [
+                "customer_id",
+                "name",
+                "budget_amount_micros",
+                "advertising_channel_type",
+                "status",
+                "budget_delivery_method",
+            ],
+        )
+
+
+class TestUpdateCampaign(unittest.TestCase):
+    """Test cases for update_campaign."""
+
+    _BUDGET = "customers/1234567890/campaignBudgets/111"
+
+    def setUp(self):
+        self.mutate = mock.Mock()
+        for name, value in (
+            ("_get_type", mock.Mock(return_value=_FakeGoogleAdsFailure())),
+            ("_get_ga_service", mock.Mock()),
+            ("_acquire_operation", mock.MagicMock),
+            ("_mutate", self.mutate),
+        ):
+            patcher = mock.patch.object(mutations, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        mutations._cache_budget_resource_name("1234567890", "222", self._BUDGET)
+        self.addCleanup(mutations._budget_resource_names.clear)
+
+    def _update(self):
+        return mutations.update_campaign(
+            "1234567890", "222", name="Renamed", budget_amount_micros=2000000
+        )
+
+    def test_located_budget_error(self):
+        """Tests that a failed budget operation is reported and uncached."""
+        self.mutate.return_value = _make_partial_failure_response(
+            [_make_error("budget failed", index=0)]
+        )
+
+        result = self._update()
+
+        self.assertFalse(result["success"])
+        self.assertFalse(result["budget_updated"])
+        self.assertEqual(mutations._budget_resource_names, {})
+
+    def test_unlocated_error_is_not_blamed_on_budget(self):
+        """Tests that an error without a location keeps the budget update."""
+        self.mutate.return_value = _make_partial_failure_response(
+            [_make_error("no location")]
+        )
+
+        result = self._update()
+
+        self.assertFalse(result["success"])
+        self.assertTrue(result["budget_updated"])
+        self.assertIn(("1234567890", "222"), mutations._budget_resource_names)
+
+
+class _FakeMutateRequest:
+    """Stands in for MutateGoogleAdsRequest."""
+
+    def __init__(self):
+        self.customer_id = ""
+        self.mutate_operations = []
+        self.partial_failure = False
+        self.response_content_type = 0
+
+
+def _make_create_operation(operation_field, parent_field, parent):
+    """Returns a MutateOperation-like object creating a child of parent."""
+    return _make_operation(
+        operation_field, "create", SimpleNamespace(**{parent_field: parent})
+    )
+
+
+class TestMutate(unittest.TestCase):
+    """Test cases for _mutate."""
+
+    _AD_GROUP_1 = "customers/1234567890/adGroups/1"
+    _AD_GROUP_2 = "customers/1234567890/adGroups/2"
+
+    def setUp(self):
+        self.locked_names = []
+        get_resource_lock = mutations._get_resource_lock
+
+        def recording_get_resource_lock(resource_name):
+            self.locked_names.append(resource_name)
+            return get_resource_lock(resource_name)
+
+        for name, value in (
+            ("_get_type", lambda type_name: _FakeMutateRequest()),
+            ("_get_enum_value", mock.Mock(return_value=2)),
+            ("_release_operations", mock.Mock()),
+            ("_get_resource_lock", recording_get_resource_lock),
+        ):
+            patcher = mock.patch.object(mutations, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.ga_service = mock.Mock()
+
+    def test_request_fields(self):
+        """Tests that the request carries the operations and options."""
+        operations = [
+            _make_create_operation(
+                "ad_group_criterion_operation", "ad_group", self._AD_GROUP_1
+            )
+        ]
+
+        mutations._mutate(self.ga_service, "1234567890", operations)
+
+        request = self.ga_service.mutate.call_args.kwargs["request"]
+        self.assertEqual(request.customer_id, "1234567890")
+        self.assertEqual(request.mutate_operations, operations)
+        self.assertTrue(request.partial_failure)
+        self.assertEqual(request.response_content_type, 2)
+        mutations._get_enum_value.assert_called_once_with(
+            "ResponseContentTypeEnum", "RESOURCE_NAME_ONLY"
+        )
+        mutations._release_operations.assert_called_once_with(operations)
+
+    def test_atomic_request_without_content_type(self):
+        """Tests that partial failure and the content type can be left off."""
+        mutations._mutate(
+            self.ga_service,
+            "1234567890",
+            [],
+            response_content_type=None,
+            partial_failure=False,
+        )
+
+        request = self.ga_service.mutate.call_args.kwargs["request"]
+        self.assertFalse(request.partial_failure)
+        self.assertEqual(request.response_content_type, 0)
+        mutations._get_enum_value.assert_not_called()
+
+    def test_locks_are_sorted_and_held_during_mutate(self):
+        """Tests that each touched resource is locked while the request runs."""
+
+        def check_locks(request):
+            for resource_name in (self._AD_GROUP_1, self._AD_GROUP_2):
+                lock = mutations._resource_locks[resource_name]
+                self.assertTrue(lock.locked())
+
+        self.ga_service.mutate.side_effect = check_locks
+        operations = [
+            _make_create_operation(
+                "ad_group_criterion_operation", "ad_group", self._AD_GROUP_2
+            ),
+            _make_create_operation(
+                "ad_group_ad_operation", "ad_group", self._AD_GROUP_1
+            ),
+            _make_create_operation(
+                "ad_group_criterion_operation", "ad_group", self._AD_GROUP_2
+            ),
+        ]
+
+        mutations._mutate(self.ga_service, "1234567890", operations)
+
+        self.ga_service.mutate.assert_called_once()
+        self.assertEqual(
+            self.locked_names, [self._AD_GROUP_1, self._AD_GROUP_2]
+        )
+        for resource_name in self.locked_names:
+            lock = mutations._resource_locks.get(resource_name)
+            self.assertFalse(lock is not None and lock.locked())
+
+    def test_temporary_parents_are_not_locked(self):
+        """Tests that resources created in the same request aren't locked."""
+        operations = [
+            _make_create_operation(
+                "ad_group_operation",
+                "campaign",
+                "customers/1234567890/campaigns/-2",
+            ),
+            _make_create_operation(
+                "ad_group_criterion_operation",
+                "ad_group",
+                "customers/1234567890/adGroups/-3",
+            ),
+        ]
+
+        mutations._mutate(self.ga_service, "1234567890", operations)
+
+        self.ga_service.mutate.assert_called_once()
+        self.assertEqual(self.locked_names, [])
+
+
+class TestOperationPool(unittest.TestCase):
+    """Test cases for _acquire_operation and _release_operations."""
+
+    def setUp(self):
+        mutations._operation_pool.operations = []
+        self.addCleanup(mutations._operation_pool.operations.clear)
+
+    @mock.patch.object(mutations, "_get_type")
+    def test_acquire_from_empty_pool_creates_operation(self, get_type):
+        """Tests that a new operation is created when none was released."""
+        self.assertIs(mutations._acquire_operation(), get_type.return_value)
+        get_type.assert_called_once_with("MutateOperation")
+
+    @mock.patch.object(mutations, "_get_type")
+    def test_released_operations_are_cleared_and_reused(self, get_type):
+        """Tests that released operations come back cleared."""
+        operation = mock.Mock()
+
+        mutations._release_operations([operation])
+
+        operation.Clear.assert_called_once_with()
+        self.assertIs(mutations._acquire_operation(), operation)
+        get_type.assert_not_called()
+
+    def test_pool_size_is_capped(self):
+        """Tests that no more than _MAX_POOLED_OPERATIONS are kept."""
+        operations = [mock.Mock() for _ in range(3)]
+
+        with mock.patch.object(mutations, "_MAX_POOLED_OPERATIONS", 2):
+            mutations._release_operations(operations)
+
+        self.assertEqual(mutations._operation_pool.operations, operations[:2])
+        operations[2].Clear.assert_not_called()
+
+    def test_mutate_copies_operations_before_releasing_them(self):
+        """Tests that operations are in the request before they are cleared."""
+        request = _FakeMutateRequest()
+        operations = [
+            _make_create_operation(
+                "ad_group_operation",
+                "campaign",
+                "customers/1234567890/campaigns/-2",
+            )
+        ]
+
+        def check_request(mutate_operations):
+            self.assertEqual(request.mutate_operations, operations)
+
+        with mock.patch.object(
+            mutations, "_get_type", return_value=request
+        ), mock.patch.object(
+            mutations, "_get_enum_value", return_value=2
+        ), mock.patch.object(
+            mutations, "_release_operations", side_effect=check_request
+        ) as release_operations:
+            mutations._mutate(mock.Mock(), "1234567890", operations)
+
+        release_operations.assert_called_once_with(operations)